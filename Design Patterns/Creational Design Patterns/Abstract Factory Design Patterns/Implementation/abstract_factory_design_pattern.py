@@ -1,93 +1,96 @@
 from abc import ABC, abstractmethod
 
-class Notification(ABC):
+from product_registry import ProductRegistry, RegisteredProduct
+
+class Notification(RegisteredProduct, ABC):
+    registry = ProductRegistry('Notification')
+    stateless = True
+
     @abstractmethod
     def get_notification(self):
-        pass 
+        pass
 
     @abstractmethod
     def send_notification(self, recipient):
         pass
 
-class SMSNotification(Notification):
+class SMSNotification(Notification, key = 'sms'):
     def get_notification(self):
         return 'SMS'
-    
+
     def send_notification(self, recipient):
         print(f'SMS sent to {recipient}')
 
-class EmailNotification(Notification):
+class EmailNotification(Notification, key = 'email'):
     def get_notification(self):
         return 'Email'
-    
+
     def send_notification(self, recipient):
         print(f'Email sent to {recipient}')
 
-class Order(ABC):
+class Order(RegisteredProduct, ABC):
+    registry = ProductRegistry('Order')
+
     @abstractmethod
     def get_order(self):
-        pass 
+        pass
 
-    @abstractmethod    
+    @abstractmethod
     def mark_order_delivered(self):
         pass
 
-class CustomerOrder(Order):
+class CustomerOrder(Order, key = 'customer'):
     def get_order(self):
         return 'Customer Order'
-    
+
     def mark_order_delivered(self):
         print('Customer Order Marked Delivered')
 
-class MerchantOrder(Order):
+class MerchantOrder(Order, key = 'merchant'):
     def get_order(self):
         return 'Merchant Order'
-    
+
     def mark_order_delivered(self):
         print('Merchant Order Delivered')
 
-class AbstractFactory(ABC):
+class AbstractFactory(RegisteredProduct, ABC):
+    registry = ProductRegistry('Factory')
+    stateless = True
+
     @abstractmethod
     def getOrder(self, order):
-        pass 
+        pass
 
-    @abstractmethod    
+    @abstractmethod
     def getNotification(self, notification):
         pass
 
-class OrderFactory(AbstractFactory):
+class OrderFactory(AbstractFactory, key = 'order'):
     def getOrder(self, order):
-        if order == 'customer':
-            return CustomerOrder()
-        if order == 'merchant':
-            return MerchantOrder()
-        raise ValueError(f'Invalid Order type: {order}')
-    
+        return Order.registry.create(order)
+
     def getNotification(self, notification):
         raise NotImplementedError('Invalid  operation')
 
-class NotificationFactory(AbstractFactory):
+class NotificationFactory(AbstractFactory, key = 'notification'):
     def getOrder(self, order):
        raise NotImplementedError('Invalid  operation')
 
     def getNotification(self, notification):
-        if notification == 'sms':
-            return SMSNotification()
-        if notification == 'email':
-            return EmailNotification()
-        raise ValueError('Invalid Notification Type') 
+        return Notification.registry.create(notification)
 
 class FactoryCreator:
     @staticmethod
     def getFactory(factory):
-        if factory == 'order':
-            return OrderFactory()
-        if factory == 'notification':
-            return NotificationFactory()
-        raise ValueError('Invalid Factory type')
+        return AbstractFactory.registry.create(factory)
+
+if __name__ == '__main__':
+    factory = FactoryCreator.getFactory('order')
+
+    order = factory.getOrder('customer')
 
-factory = FactoryCreator.getFactory('order')
+    order.mark_order_delivered()
 
-order = factory.getOrder('customer')
+    notification = FactoryCreator.getFactory('notification').getNotification('sms')
 
-order.mark_order_delivered()
\ No newline at end of file
+    notification.send_notification('+91 98765 43210')
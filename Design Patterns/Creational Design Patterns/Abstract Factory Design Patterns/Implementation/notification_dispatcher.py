@@ -0,0 +1,145 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+from abstract_factory_design_pattern import FactoryCreator
+
+
+class DeliveryError(Exception):
+    pass
+
+
+class LocalSink:
+    # Stand-in for an SMTP server or SMS gateway: takes some time per
+    # message, fails a fraction of them, and records what was delivered.
+    def __init__(self, latency = 0.005, jitter = 0.003, failure_rate = 0.0, seed = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.delivered = []
+        self._random = random.Random(seed)
+
+    async def deliver(self, notification, recipient, message):
+        await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if self._random.random() < self.failure_rate:
+            raise DeliveryError(f'{notification.get_notification()} gateway rejected {recipient}')
+        self.delivered.append((notification.get_notification(), recipient, message))
+
+
+class DispatchReport:
+    def __init__(self):
+        self.sent = defaultdict(int)
+        self.failed = defaultdict(list)  # channel -> [(recipient, error)]
+        self.retries = defaultdict(int)
+        self.latencies = defaultdict(list)  # seconds per delivered message
+        self.elapsed = 0.0
+
+    @property
+    def sends_per_second(self):
+        return sum(self.sent.values()) / self.elapsed if self.elapsed else 0.0
+
+    def latency_percentile(self, channel, q):
+        latencies = sorted(self.latencies[channel])
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    def summary(self):
+        return {
+            channel: {
+                'sent': self.sent[channel],
+                'failed': len(self.failed[channel]),
+                'retries': self.retries[channel],
+                'p50_ms': round(self.latency_percentile(channel, 0.50) * 1e3, 2),
+                'p99_ms': round(self.latency_percentile(channel, 0.99) * 1e3, 2),
+            }
+            for channel in sorted(self.sent.keys() | self.failed.keys())
+        }
+
+
+class NotificationDispatcher:
+    # Fans a recipient batch out per channel. Each channel gets a fixed
+    # number of worker coroutines (its concurrency limit) pulling from its
+    # own queue, and failed sends are retried with exponential backoff.
+
+    def __init__(self, sinks, concurrency = None, default_concurrency = 10,
+                 max_retries = 3, backoff = 0.01, max_backoff = 1.0):
+        self._factory = FactoryCreator.getFactory('notification')
+        self._sinks = sinks  # channel -> object with async deliver(notification, recipient, message)
+        self._concurrency = concurrency or {}
+        self._default_concurrency = default_concurrency
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+    async def dispatch(self, recipients, message = ''):
+        # recipients: {'sms': [...], 'email': [...]} or an iterable of (channel, recipient)
+        by_channel = recipients if isinstance(recipients, dict) else self._group(recipients)
+        report = DispatchReport()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(self._dispatch_channel(channel, batch, message, report)
+                               for channel, batch in by_channel.items()))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    async def _dispatch_channel(self, channel, recipients, message, report):
+        notification = self._factory.getNotification(channel)
+        sink = self._sinks[channel]
+        queue = asyncio.Queue()
+        for recipient in recipients:
+            queue.put_nowait(recipient)
+
+        async def worker():
+            while not queue.empty():
+                recipient = queue.get_nowait()
+                await self._send(channel, notification, sink, recipient, message, report)
+
+        workers = min(self._concurrency.get(channel, self._default_concurrency), queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def _send(self, channel, notification, sink, recipient, message, report):
+        # Latency is end to end, including retries and backoff
+        delay = self._backoff
+        start = time.perf_counter()
+        for attempt in range(self._max_retries + 1):
+            try:
+                await sink.deliver(notification, recipient, message)
+            except Exception as e:
+                if attempt == self._max_retries:
+                    report.failed[channel].append((recipient, e))
+                    return
+                report.retries[channel] += 1
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))  # jitter spreads retries out
+                delay = min(delay * 2, self._max_backoff)
+            else:
+                report.latencies[channel].append(time.perf_counter() - start)
+                report.sent[channel] += 1
+                return
+
+    @staticmethod
+    def _group(recipients):
+        by_channel = defaultdict(list)
+        for channel, recipient in recipients:
+            by_channel[channel].append(recipient)
+        return by_channel
+
+
+# Client Code
+if __name__ == '__main__':
+    sinks = {
+        'sms': LocalSink(latency = 0.004, failure_rate = 0.02, seed = 1),
+        'email': LocalSink(latency = 0.010, failure_rate = 0.01, seed = 2),
+    }
+    dispatcher = NotificationDispatcher(sinks, concurrency = {'sms': 200, 'email': 100})
+
+    recipients = {
+        'sms': [f'+91 90000 {i:05d}' for i in range(20_000)],
+        'email': [f'customer{i}@example.com' for i in range(10_000)],
+    }
+    report = asyncio.run(dispatcher.dispatch(recipients, message = 'Your order has been delivered'))
+
+    for channel, stats in report.summary().items():
+        print(f'{channel}: {stats}')
+    print(f'{report.sends_per_second:,.0f} sends/sec over {report.elapsed:.2f}s')
@@ -0,0 +1,82 @@
+# Same ProductRegistry as Factory Method Design Patterns/Implementation, kept
+# here so this folder runs on its own without touching sys.path
+import importlib
+import threading
+
+
+class UnknownProductError(ValueError):
+    pass
+
+
+class ProductRegistry:
+    # Replaces `if kind == 'a': ... elif kind == 'b': ...` chains with one
+    # dict lookup. Products register themselves (see RegisteredProduct),
+    # or are registered lazily as 'module:ClassName' and only imported the
+    # first time somebody asks for them.
+
+    def __init__(self, kind):
+        self.kind = kind
+        self._classes = {}
+        self._lazy = {}
+        self._instances = {}  # cached instances of stateless products
+        self._lock = threading.Lock()
+
+    def register(self, key, cls):
+        self._classes[key] = cls
+
+    def register_lazy(self, key, target):
+        self._lazy[key] = target
+
+    def load_entry_points(self, group):
+        # Products shipped by other installed packages, e.g. in pyproject.toml:
+        # [project.entry-points."shapes"]  hexagon = "hexagon_shape:Hexagon"
+        from importlib.metadata import entry_points  # slow to import, only pay for it here
+        for entry_point in entry_points(group = group):
+            self.register_lazy(entry_point.name, entry_point.value)
+
+    def keys(self):
+        return sorted(self._classes.keys() | self._lazy.keys())
+
+    def get_class(self, key):
+        cls = self._classes.get(key)
+        if cls is None:
+            target = self._lazy.get(key)
+            if target is None:
+                raise UnknownProductError(f'Invalid {self.kind} type: {key}')
+            module_name, _, class_name = target.partition(':')
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self._classes[key] = cls
+        return cls
+
+    def create(self, key, *args, **kwargs):
+        # The cached instance was built without arguments, never hand it
+        # out for a call that passes some
+        if args or kwargs:
+            return self.get_class(key)(*args, **kwargs)
+
+        instance = self._instances.get(key)
+        if instance is not None:
+            return instance
+
+        cls = self.get_class(key)
+        if not getattr(cls, 'stateless', False):
+            return cls()
+
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = self._instances[key] = cls()
+        return instance
+
+
+class RegisteredProduct:
+    # Give the base product a `registry`; subclasses then join it with
+    # `class Circle(Shape, key='circle')`. Set `stateless = True` on products
+    # that can be shared, so the registry hands out one cached instance.
+    registry = None
+    stateless = False
+
+    def __init_subclass__(cls, key = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if key is not None:
+            cls.registry.register(key, cls)
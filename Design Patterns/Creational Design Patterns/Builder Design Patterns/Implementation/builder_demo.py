@@ -76,21 +76,22 @@ class EmployeeBuilder:
     def build(self):
         return Employee(self.id, self.firstname, self.lastname, self.age, self.gender, self.dept, self.salary)
 
-employeeBuilder = EmployeeBuilder()
-departmentBuilder = DepartmentBuilder()
+if __name__ == '__main__':
+    employeeBuilder = EmployeeBuilder()
+    departmentBuilder = DepartmentBuilder()
 
 
-emp = ( 
-        employeeBuilder.set_id(1)
-                    .set_firstname('Vikram')
-                    .set_lastname('Rathore')
-                    .set_age(29)
-                    .set_gender('Male')
-                    .set_salary(100000)
-                    .set_dept(departmentBuilder.set_id(1)
-                          .set_name('IT')
-                          .build())
-                    .build() 
-       )
+    emp = ( 
+            employeeBuilder.set_id(1)
+                        .set_firstname('Vikram')
+                        .set_lastname('Rathore')
+                        .set_age(29)
+                        .set_gender('Male')
+                        .set_salary(100000)
+                        .set_dept(departmentBuilder.set_id(1)
+                              .set_name('IT')
+                              .build())
+                        .build() 
+           )
 
-print(emp)
+    print(emp)
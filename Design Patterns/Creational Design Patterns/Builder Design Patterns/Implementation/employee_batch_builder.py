@@ -0,0 +1,220 @@
+import csv
+import sys
+from array import array
+
+import numpy as np
+
+from builder_demo import Department
+
+
+# Builder for many employees at once. Rows are appended column by column
+# and build() returns an EmployeeBatch of NumPy arrays, instead of one
+# Employee object (with its own __dict__) per row.
+
+FIELDS = ('id', 'firstname', 'lastname', 'age', 'gender', 'dept_id', 'dept_name', 'salary')
+
+
+class _StringColumn:
+    # Dictionary encoded: each distinct string is stored once (interned)
+    # and rows hold an int32 code into the value list.
+    def __init__(self):
+        self.codes = array('i')
+        self.values = []
+        self._lookup = {}
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        self.codes.append(code)
+
+
+class EmployeeBatch:
+    def __init__(self, ids, ages, salaries, firstnames, lastnames, genders,
+                 dept_codes, departments):
+        self.id = ids
+        self.age = ages
+        self.salary = salaries
+        self._firstname = firstnames  # (codes, values)
+        self._lastname = lastnames
+        self._gender = genders
+        self.dept_code = dept_codes
+        self.departments = departments  # one shared Department per distinct dept
+
+    def __len__(self):
+        return len(self.id)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('employee index out of range')
+        return EmployeeView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield EmployeeView(self, index)
+
+    def firstname(self, index):
+        codes, values = self._firstname
+        return values[codes[index]]
+
+    def lastname(self, index):
+        codes, values = self._lastname
+        return values[codes[index]]
+
+    def gender(self, index):
+        codes, values = self._gender
+        return values[codes[index]]
+
+    def total_salary_by_department(self):
+        totals = np.bincount(self.dept_code, weights = self.salary, minlength = len(self.departments))
+        return {dept.name: float(total) for dept, total in zip(self.departments, totals)}
+
+    @property
+    def nbytes(self):
+        arrays = (self.id, self.age, self.salary, self.dept_code,
+                  self._firstname[0], self._lastname[0], self._gender[0])
+        return sum(column.nbytes for column in arrays)
+
+
+class EmployeeView:
+    # Same fields and __str__ as Employee, read from the batch on demand
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def id(self):
+        return int(self._batch.id[self._index])
+
+    @property
+    def firstname(self):
+        return self._batch.firstname(self._index)
+
+    @property
+    def lastname(self):
+        return self._batch.lastname(self._index)
+
+    @property
+    def age(self):
+        return int(self._batch.age[self._index])
+
+    @property
+    def gender(self):
+        return self._batch.gender(self._index)
+
+    @property
+    def dept(self):
+        return self._batch.departments[self._batch.dept_code[self._index]]
+
+    @property
+    def salary(self):
+        return float(self._batch.salary[self._index])
+
+    def __str__(self):
+        return f'{self.firstname} - {self.lastname} aged {self.age} gender {self.gender} works in  {self.dept.name} department'
+
+
+class EmployeeBatchBuilder:
+    def __init__(self):
+        self._ids = array('q')
+        self._ages = array('h')
+        self._salaries = array('d')
+        self._firstnames = _StringColumn()
+        self._lastnames = _StringColumn()
+        self._genders = _StringColumn()
+        self._dept_codes = array('i')
+        self._departments = []
+        self._dept_lookup = {}  # (dept_id, dept_name) -> code
+
+    def add_tuple(self, row):
+        # row follows FIELDS order. Every field is converted and checked
+        # before anything is appended, so a rejected row leaves the columns
+        # the same length and the builder usable.
+        id, firstname, lastname, age, gender, dept_id, dept_name, salary = row
+        id, age, dept_id, salary = int(id), int(age), int(dept_id), float(salary)
+        if not -2 ** 63 <= id < 2 ** 63:
+            raise ValueError(f'id out of range: {id}')
+        if not 0 < age < 150:
+            raise ValueError(f'age out of range: {age}')
+        if not (isinstance(firstname, str) and isinstance(lastname, str)
+                and isinstance(gender, str) and isinstance(dept_name, str)):
+            for field, value in (('firstname', firstname), ('lastname', lastname),
+                                 ('gender', gender), ('dept_name', dept_name)):
+                if not isinstance(value, str):
+                    raise TypeError(f'{field} must be a str, not {type(value).__name__}')
+
+        self._ids.append(id)
+        self._firstnames.append(firstname)
+        self._lastnames.append(lastname)
+        self._ages.append(age)
+        self._genders.append(gender)
+        self._dept_codes.append(self._department_code(dept_id, dept_name))
+        self._salaries.append(salary)
+        return self
+
+    def add_row(self, row):
+        return self.add_tuple([row[field] for field in FIELDS])
+
+    def add_rows(self, rows):
+        for row in rows:
+            if isinstance(row, dict):
+                self.add_row(row)
+            else:
+                self.add_tuple(row)
+        return self
+
+    def add_csv(self, path):
+        # CSV with a header row naming the FIELDS columns
+        with open(path, newline = '') as f:
+            for row in csv.DictReader(f):
+                self.add_row(row)
+        return self
+
+    def build(self):
+        return EmployeeBatch(
+            ids = np.frombuffer(self._ids, dtype = np.int64).copy(),
+            ages = np.frombuffer(self._ages, dtype = np.int16).copy(),
+            salaries = np.frombuffer(self._salaries, dtype = np.float64).copy(),
+            firstnames = self._string_column(self._firstnames),
+            lastnames = self._string_column(self._lastnames),
+            genders = self._string_column(self._genders),
+            dept_codes = np.frombuffer(self._dept_codes, dtype = np.int32).copy(),
+            departments = list(self._departments),
+        )
+
+    def _department_code(self, dept_id, dept_name):
+        key = (dept_id, dept_name)
+        code = self._dept_lookup.get(key)
+        if code is None:
+            code = self._dept_lookup[key] = len(self._departments)
+            self._departments.append(Department(dept_id, sys.intern(dept_name)))
+        return code
+
+    @staticmethod
+    def _string_column(column):
+        return np.frombuffer(column.codes, dtype = np.int32).copy(), list(column.values)
+
+
+# Client Code
+if __name__ == '__main__':
+    batch = (
+        EmployeeBatchBuilder()
+            .add_row({'id': 1, 'firstname': 'Vikram', 'lastname': 'Rathore', 'age': 29,
+                      'gender': 'Male', 'dept_id': 1, 'dept_name': 'IT', 'salary': 100000})
+            .add_tuple((2, 'Asha', 'Nair', 34, 'Female', 1, 'IT', 120000))
+            .add_rows([(3, 'Ravi', 'Kumar', 41, 'Male', 2, 'Finance', 95000),
+                       (4, 'Meera', 'Iyer', 26, 'Female', 2, 'Finance', 70000)])
+            .build()
+    )
+
+    for employee in batch:
+        print(employee)
+
+    print(batch[0].dept is batch[1].dept)  # Both share one IT Department
+    print(batch.total_salary_by_department())
+    print(f'Average age: {batch.age.mean()}')
@@ -0,0 +1,159 @@
+import csv
+import json
+import os
+import sys
+from itertools import islice
+
+from builder_demo import DepartmentBuilder, EmployeeBuilder
+from employee_batch_builder import FIELDS
+
+
+class InvalidEmployeeRecord(ValueError):
+    pass
+
+
+class DepartmentTable:
+    # Interning table: one Department per (id, name), however many
+    # employees reference it.
+    def __init__(self):
+        self._departments = {}
+        self._builder = DepartmentBuilder()
+
+    def get(self, dept_id, dept_name):
+        key = (dept_id, dept_name)
+        department = self._departments.get(key)
+        if department is None:
+            department = self._departments[key] = (
+                self._builder.set_id(dept_id).set_name(sys.intern(dept_name)).build()
+            )
+        return department
+
+    def __len__(self):
+        return len(self._departments)
+
+
+class EmployeeStream:
+    # Reads records lazily, checks them a batch at a time and yields
+    # Employee objects. Memory stays at one batch plus the department table.
+
+    def __init__(self, batch_size = 1000, on_error = 'raise', departments = None):
+        self.batch_size = batch_size
+        self.on_error = on_error  # 'raise' or 'skip'
+        self.departments = DepartmentTable() if departments is None else departments
+        self.skipped = 0
+        self._required = frozenset(FIELDS)
+
+    def from_jsonl(self, path):
+        with open(path) as f:
+            # Lines are parsed inside _validate, so a malformed one is handled
+            # like any other invalid record
+            yield from self._employees((line for line in f if line.strip()), parse = json.loads)
+
+    def from_csv(self, path):
+        with open(path, newline = '') as f:
+            reader = csv.DictReader(f)
+            # A CSV header is the schema, check it once for the whole file
+            missing = self._required - set(reader.fieldnames or ())
+            if missing:
+                raise InvalidEmployeeRecord(f'CSV is missing columns: {sorted(missing)}')
+            yield from self._employees(reader)
+
+    def from_path(self, path):
+        if path.endswith('.csv'):
+            return self.from_csv(path)
+        return self.from_jsonl(path)
+
+    def _employees(self, records, parse = None):
+        builder = EmployeeBuilder()
+        department = self.departments.get
+
+        for batch in self._batches(records):
+            for id, firstname, lastname, age, gender, dept_id, dept_name, salary in self._validate(batch, parse):
+                yield (builder.set_id(id)
+                              .set_firstname(firstname)
+                              .set_lastname(lastname)
+                              .set_age(age)
+                              .set_gender(gender)
+                              .set_salary(salary)
+                              .set_dept(department(dept_id, dept_name))
+                              .build())
+
+    def _batches(self, records):
+        records = iter(records)
+        while batch := list(islice(records, self.batch_size)):
+            yield batch
+
+    def _validate(self, batch, parse = None):
+        # One pass of conversions per batch. The common case (every record
+        # well formed) costs a single try block for the whole batch.
+        convert = self._convert
+        if parse is not None:
+            convert = lambda record: self._convert(parse(record))  # json.JSONDecodeError is a ValueError
+        try:
+            return [convert(record) for record in batch]
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        rows = []
+        for record in batch:
+            try:
+                rows.append(convert(record))
+            except (KeyError, TypeError, ValueError) as e:
+                if self.on_error == 'raise':
+                    raise InvalidEmployeeRecord(f'Invalid employee record {record!r}: {e!r}') from e
+                self.skipped += 1
+        return rows
+
+    @staticmethod
+    def _convert(record):
+        age = int(record['age'])
+        if not 0 < age < 150:
+            raise ValueError(f'age out of range: {age}')
+        firstname, lastname = record['firstname'], record['lastname']
+        gender, dept_name = record['gender'], record['dept_name']
+        # JSON can carry any type; names must be str before they are interned
+        if not (isinstance(firstname, str) and isinstance(lastname, str)
+                and isinstance(gender, str) and isinstance(dept_name, str)):
+            raise TypeError('firstname, lastname, gender and dept_name must be strings')
+        return (int(record['id']), firstname, lastname, age,
+                gender, int(record['dept_id']), dept_name,
+                float(record['salary']))
+
+
+# Client Code
+if __name__ == '__main__':
+    import tempfile
+    import tracemalloc
+
+    departments = [(1, 'IT'), (2, 'Finance'), (3, 'HR')]
+
+    def write_jsonl(path, count):
+        with open(path, 'w') as f:
+            for id in range(count):
+                dept_id, dept_name = departments[id % len(departments)]
+                f.write(json.dumps({'id': id, 'firstname': 'Vikram', 'lastname': 'Rathore',
+                                    'age': 20 + id % 40, 'gender': 'Male', 'dept_id': dept_id,
+                                    'dept_name': dept_name, 'salary': 50000 + id % 1000}) + '\n')
+            f.write('{"id": "oops"}\n')  # invalid record
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'employees.jsonl')
+
+        for count in (10_000, 200_000):
+            write_jsonl(path, count)
+            stream = EmployeeStream(on_error = 'skip')
+
+            tracemalloc.start()
+            total_salary = 0.0
+            for employee in stream.from_path(path):
+                total_salary += employee.salary
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f'{count:>7,} records: departments={len(stream.departments)} '
+                  f'skipped={stream.skipped} peak memory={peak / 1e6:.2f} MB')
+
+        stream = EmployeeStream()
+        first, second = islice(stream.from_path(path), 2)
+        print(first)
+        print(first.dept is stream.departments.get(1, 'IT'))
@@ -1,29 +1,34 @@
 from abc import ABC, abstractmethod
 
-class Logger(ABC):
+from product_registry import ProductRegistry, RegisteredProduct
+
+class Logger(RegisteredProduct, ABC):
+    registry = ProductRegistry('logger')
+    stateless = True
 
     @abstractmethod
     def log(self, message):
         pass
 
-class FileLogger(Logger):
-    def log(self, message):
-        return f'logging to file: {message}'
-
-class ConsoleLogger(Logger):
+class ConsoleLogger(Logger, key = 'console'):
     def log(self, message):
         return f'logging to console: {message}'
 
+# Buffered, rotating file logger; imported on first use
+Logger.registry.register_lazy('file', 'file_logger:FileLogger')
+
 class LoggerFactory:
     @staticmethod
-    def create_logger(logger_type):
-        if logger_type == 'file':
-            return FileLogger()
-        elif logger_type == 'console':
-            return ConsoleLogger()
-        else:
-            raise ValueError('Unknown logger type')
+    def create_logger(logger_type, *args, **kwargs):
+        return Logger.registry.create(logger_type, *args, **kwargs)
+
+if __name__ == '__main__':
+    import os, tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger = LoggerFactory.create_logger('file', os.path.join(directory, 'app.log'))
 
-logger = LoggerFactory.create_logger('file')
+        logger.log('File has been saved')
+        logger.close()
 
-print(logger.log('File has been saved'))
\ No newline at end of file
+    print(LoggerFactory.create_logger('console').log('File has been saved'))
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+# Generates N product modules and compares an eager factory (imports every
+# module, dispatches through an if-chain) with a lazy registry factory
+# (imports only the requested module, dispatches through a dict).
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+BASE_MODULE = '''
+from product_registry import ProductRegistry, RegisteredProduct
+
+class Product(RegisteredProduct):
+    registry = ProductRegistry('product')
+    stateless = True
+'''
+
+PRODUCT_MODULE = '''
+from bench_base import Product
+
+# Stands in for the constants and helpers a real product module defines
+RATES = {{f'rate{{i}}': i * 0.5 for i in range(200)}}
+
+class Product{i}(Product, key = 'product{i}'):
+    def run(self):
+        return {i}
+'''
+
+
+def write_modules(directory, count):
+    with open(os.path.join(directory, 'bench_base.py'), 'w') as f:
+        f.write(BASE_MODULE)
+
+    for i in range(count):
+        with open(os.path.join(directory, f'product{i}.py'), 'w') as f:
+            f.write(PRODUCT_MODULE.format(i = i))
+
+    with open(os.path.join(directory, 'eager_factory.py'), 'w') as f:
+        for i in range(count):
+            f.write(f'from product{i} import Product{i}\n')
+        f.write('\ndef create(kind):\n')
+        for i in range(count):
+            f.write(f"    if kind == 'product{i}':\n        return Product{i}()\n")
+        f.write("    raise ValueError(f'Invalid product type: {kind}')\n")
+
+    with open(os.path.join(directory, 'lazy_factory.py'), 'w') as f:
+        f.write('from bench_base import Product\n\n')
+        for i in range(count):
+            f.write(f"Product.registry.register_lazy('product{i}', 'product{i}:Product{i}')\n")
+        f.write('\ncreate = Product.registry.create\n')
+
+
+def startup_seconds(directory, factory, kind, runs = 5):
+    # Fresh interpreter per run; the first run also warms the bytecode cache
+    code = ('import time; start = time.perf_counter(); '
+            f'import {factory}; {factory}.create({kind!r}); '
+            'print(time.perf_counter() - start)')
+    env = dict(os.environ, PYTHONPATH = os.pathsep.join((directory, HERE)))
+    timings = []
+    for _ in range(runs + 1):
+        output = subprocess.run([sys.executable, '-c', code], env = env,
+                                capture_output = True, text = True, check = True).stdout
+        timings.append(float(output))
+    return min(timings[1:])
+
+
+def lookup_seconds(directory, factory, kind, number = 20000):
+    sys.path[:0] = [directory]
+    try:
+        module = __import__(factory)
+        return timeit.timeit(lambda: module.create(kind), number = number) / number
+    finally:
+        sys.path.remove(directory)
+
+
+if __name__ == '__main__':
+    print(f'{"products":>9} {"eager startup":>14} {"lazy startup":>13} {"if-chain lookup":>16} {"registry lookup":>16}')
+    for count in (10, 100, 500):
+        with tempfile.TemporaryDirectory() as directory:
+            write_modules(directory, count)
+            last = f'product{count - 1}'
+            eager = startup_seconds(directory, 'eager_factory', last)
+            lazy = startup_seconds(directory, 'lazy_factory', last)
+            chain = lookup_seconds(directory, 'eager_factory', last)
+            registry = lookup_seconds(directory, 'lazy_factory', last)
+            for name in [m for m in sys.modules if m.startswith(('product', 'eager_', 'lazy_', 'bench_'))]:
+                if name != 'product_registry':
+                    del sys.modules[name]
+        print(f'{count:>9} {eager * 1e3:>12.1f}ms {lazy * 1e3:>11.1f}ms '
+              f'{chain * 1e9:>14.0f}ns {registry * 1e9:>14.0f}ns')
@@ -0,0 +1,236 @@
+import atexit
+import os
+import threading
+import time
+import weakref
+from collections import deque
+
+from factory_method_pattern import Logger
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+
+_open_loggers = weakref.WeakSet()
+
+
+def _close_all():
+    # The writer is a daemon thread, so like logging.shutdown, write out
+    # whatever is still buffered before the interpreter exits
+    for logger in list(_open_loggers):
+        logger.close()
+
+
+atexit.register(_close_all)
+
+
+class FileLogger(Logger, key = 'file'):
+    # Callers only append a raw record to a deque (atomic, no lock taken).
+    # A background writer thread formats records in batches, writes each
+    # batch with a single write() call (split where the file rotates) and
+    # rotates the file by size or age.
+    stateless = False
+
+    def __init__(self, path = 'app.log', level = INFO, capacity = 100_000, batch_size = 1000,
+                 flush_interval = 0.2, fsync = 'never', fsync_interval = 1.0,
+                 max_bytes = None, rotate_interval = None, backup_count = 5):
+        self.path = path
+        self.level = level
+        self.dropped = 0  # records refused because the buffer was full, or lost to a write error
+        self.write_errors = 0
+        self.last_error = None  # the most recent error from write, fsync or rotate
+
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._fsync = fsync  # 'never', 'batch' (after every write) or 'interval'
+        self._fsync_interval = fsync_interval
+        self._max_bytes = max_bytes
+        self._rotate_interval = rotate_interval
+        self._backup_count = backup_count
+
+        self._buffer = deque()
+        self._wakeup = threading.Event()
+        self._flush_requests = deque()
+        self._closed = False
+
+        self._open()
+        self._writer = threading.Thread(target = self._run, name = 'file-logger', daemon = True)
+        self._writer.start()
+        _open_loggers.add(self)
+
+    def log(self, message, *args, level = INFO):
+        # Formatting (message % args) is deferred to the writer thread, and
+        # skipped entirely when the level is disabled
+        if level < self.level or self._closed:
+            return
+        buffer = self._buffer
+        if len(buffer) >= self._capacity:
+            self.dropped += 1
+            return
+        buffer.append((time.time(), level, message, args))
+        if len(buffer) == self._batch_size:
+            self._wakeup.set()
+
+    def debug(self, message, *args):
+        if self.level <= DEBUG:
+            self.log(message, *args, level = DEBUG)
+
+    def info(self, message, *args):
+        if self.level <= INFO:
+            self.log(message, *args, level = INFO)
+
+    def warning(self, message, *args):
+        if self.level <= WARNING:
+            self.log(message, *args, level = WARNING)
+
+    def error(self, message, *args):
+        if self.level <= ERROR:
+            self.log(message, *args, level = ERROR)
+
+    def flush(self, timeout = None):
+        # Blocks until everything logged so far is written. Returns False on
+        # timeout, or straight away once the writer has stopped.
+        if self._closed or not self._writer.is_alive():
+            return not self._buffer
+        done = threading.Event()
+        self._flush_requests.append(done)
+        self._wakeup.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._flush_interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return False
+            if done.wait(wait):
+                return True
+            if not self._writer.is_alive():  # closed while we were waiting
+                return not self._buffer
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+        self._writer.join()
+        self._file.close()
+        _open_loggers.discard(self)
+
+    def _run(self):
+        last_fsync = time.monotonic()
+        while True:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            closing = self._closed
+
+            while self._buffer:
+                self._write_batch()
+
+            now = time.monotonic()
+            if self._fsync == 'interval' and now - last_fsync >= self._fsync_interval:
+                self._sync()
+                last_fsync = now
+
+            while self._flush_requests:
+                self._flush_requests.popleft().set()
+
+            if closing:
+                if self._fsync != 'never':
+                    self._sync()
+                return
+
+    def _write_batch(self):
+        buffer = self._buffer
+        records = [buffer.popleft() for _ in range(min(len(buffer), self._batch_size))]
+        lines = []
+        for created, level, message, args in records:
+            if args:
+                try:
+                    message = message % args
+                except (TypeError, ValueError) as e:
+                    message = f'{message!r} % {args!r} failed: {e}'
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+            line = f'{timestamp}.{int(created % 1 * 1000):03d} {LEVEL_NAMES.get(level, level)} {message}\n'
+            try:
+                lines.append(line.encode('utf-8'))
+            except UnicodeEncodeError as e:  # e.g. a lone surrogate, lose only this record
+                self.dropped += 1
+                self._record_error(e)
+
+        written = 0  # records already in the file, the rest are lost on error
+        try:
+            if self._file.closed:  # a failed rotation left no file open
+                self._open()
+            if self._rotate_interval is not None and time.monotonic() - self._opened_at >= self._rotate_interval:
+                self._rotate()
+            max_bytes = self._max_bytes
+            size = self._bytes_written
+            for index, line in enumerate(lines):
+                # Like RotatingFileHandler, rotate before the record that would
+                # take the file past max_bytes; one oversized record still fits
+                if max_bytes is not None and size and size + len(line) > max_bytes:
+                    self._write(b''.join(lines[written:index]))
+                    written = index
+                    self._rotate()
+                    size = self._bytes_written
+                size += len(line)
+            self._write(b''.join(lines[written:]))
+            written = len(lines)
+        except (OSError, ValueError) as e:  # ValueError: the file is closed
+            # Keep the writer alive: count the unwritten records as lost and go on
+            self.dropped += len(lines) - written
+            self._record_error(e)
+
+    def _write(self, data):
+        self._file.write(data)
+        self._file.flush()
+        self._bytes_written += len(data)
+        if self._fsync == 'batch':
+            os.fsync(self._file.fileno())
+
+    def _sync(self):
+        try:
+            os.fsync(self._file.fileno())
+        except (OSError, ValueError) as e:  # ValueError: the file is closed
+            self._record_error(e)
+
+    def _record_error(self, error):
+        self.write_errors += 1
+        self.last_error = error
+
+    def _open(self):
+        # Binary, so _bytes_written counts encoded UTF-8 bytes, not characters
+        self._file = open(self.path, 'ab')
+        self._bytes_written = self._file.tell()
+        self._opened_at = time.monotonic()
+
+    def _rotate(self):
+        # app.log -> app.log.1 -> app.log.2 ... keeping backup_count files
+        self._file.close()
+        for index in range(self._backup_count - 1, 0, -1):
+            source = f'{self.path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.path}.{index + 1}')
+        if self._backup_count:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self._open()
+
+
+# Client Code
+if __name__ == '__main__':
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'orders.log')
+        logger = FileLogger(path, level = INFO, max_bytes = 64 * 1024, backup_count = 3)
+
+        logger.debug('never formatted: %s', object())  # below level, costs one comparison
+        for order_id in range(5000):
+            logger.info('order %d marked delivered', order_id)
+        logger.error('payment gateway timeout for order %d', 42)
+        logger.close()
+
+        for name in sorted(os.listdir(directory)):
+            print(f'{name}: {os.path.getsize(os.path.join(directory, name))} bytes')
+        with open(path) as f:
+            print(f.readlines()[-1].strip())
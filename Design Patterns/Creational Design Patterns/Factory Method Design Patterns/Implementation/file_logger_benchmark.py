@@ -0,0 +1,70 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from file_logger import INFO, WARNING, FileLogger
+
+
+# Compares FileLogger with the stdlib logging.FileHandler. "caller" is the
+# time the logging threads spend inside log calls, "total" also includes
+# getting everything onto disk (close() for FileLogger, which drains the
+# buffer; the stdlib handler writes synchronously under its lock).
+
+RECORDS = 200_000
+
+
+def run_threads(threads, count, emit):
+    per_thread = count // threads
+
+    def work():
+        for i in range(per_thread):
+            emit('order %d marked delivered by %s', i, 'courier')
+
+    workers = [threading.Thread(target = work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_file_logger(path, threads, level = INFO):
+    logger = FileLogger(path, level = level, capacity = RECORDS)
+    start = time.perf_counter()
+    caller = run_threads(threads, RECORDS, logger.info)
+    logger.close()
+    return caller, time.perf_counter() - start
+
+
+def bench_stdlib(path, threads, level = logging.INFO):
+    logger = logging.getLogger(f'bench-{path}')
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    logger.addHandler(handler)
+    start = time.perf_counter()
+    caller = run_threads(threads, RECORDS, logger.info)
+    handler.close()
+    logger.removeHandler(handler)
+    return caller, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        print(f'{RECORDS:,} records per run')
+        print(f'{"threads":>7} {"FileLogger caller":>18} {"FileLogger total":>17} {"FileHandler total":>18}')
+        for threads in (1, 4, 16):
+            caller, total = bench_file_logger(os.path.join(directory, f'fast{threads}.log'), threads)
+            _, stdlib = bench_stdlib(os.path.join(directory, f'stdlib{threads}.log'), threads)
+            print(f'{threads:>7} {RECORDS / caller:>12,.0f} rec/s {RECORDS / total:>11,.0f} rec/s '
+                  f'{RECORDS / stdlib:>12,.0f} rec/s')
+
+        # Disabled level: INFO calls against a WARNING logger, nothing is formatted or written
+        caller, _ = bench_file_logger(os.path.join(directory, 'off.log'), 1, level = WARNING)
+        stdlib, _ = bench_stdlib(os.path.join(directory, 'stdlib_off.log'), 1, level = logging.WARNING)
+        print(f'disabled level: FileLogger {caller / RECORDS * 1e9:.0f}ns/call, '
+              f'logging {stdlib / RECORDS * 1e9:.0f}ns/call')
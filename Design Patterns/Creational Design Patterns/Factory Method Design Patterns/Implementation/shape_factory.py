@@ -1,28 +1,40 @@
 from abc import ABC, abstractmethod
 
-class Shape(ABC):
+from product_registry import ProductRegistry, RegisteredProduct, UnknownProductError
+
+class Shape(RegisteredProduct, ABC):
+    registry = ProductRegistry('shape')
+    stateless = True
+
     @abstractmethod
     def draw(self):
         pass
 
-class Circle(Shape):
+class Circle(Shape, key = 'circle'):
     def draw(self):
         print('Drawing a Circle')
 
-class Rectangle(Shape):
+class Rectangle(Shape, key = 'rectangle'):
     def draw(self):
         print('Drawing Rectangle')
 
+# Lives in its own module, imported only when first requested
+Shape.registry.register_lazy('triangle', 'triangle_shape:Triangle')
+
 class ShapeFactory:
     @staticmethod
     def getShape(shape):
-        if shape == 'circle':
-            return Circle()
-        if shape == 'rectangle':
-            return Rectangle()
-        raise NotImplementedError('Shape Not Defined')
+        try:
+            return Shape.registry.create(shape)
+        except UnknownProductError:
+            raise NotImplementedError('Shape Not Defined') from None
+
+
+if __name__ == '__main__':
+    circle = ShapeFactory.getShape('circle')
 
+    circle.draw()
 
-circle = ShapeFactory.getShape('circle')
+    triangle = ShapeFactory.getShape('triangle')
 
-circle.draw()
\ No newline at end of file
+    triangle.draw()
@@ -0,0 +1,5 @@
+from shape_factory import Shape
+
+class Triangle(Shape, key = 'triangle'):
+    def draw(self):
+        print('Drawing a Triangle')
@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+from collections import deque
+from contextlib import asynccontextmanager
+
+from objectpool_design_pattern import PoolTimeoutError
+
+
+class AsyncObjectPool:
+    # Waiters are futures on the event loop. release() resolves the oldest
+    # one with the object, so nobody polls and wakeups stay FIFO.
+
+    def __init__(self, create_instance, max_size = 10, max_concurrent_creates = 1):
+        self._create_instance = create_instance  # plain callable or coroutine function
+        self._max_size = max_size
+        self._available = []
+        self._in_use = set()
+        self._size = 0  # objects created or being created
+        self._waiters = deque()
+        # Bounds expensive constructions so a burst of waiters does not
+        # start max_size constructions at once
+        self._create_semaphore = asyncio.Semaphore(max_concurrent_creates)
+
+    async def acquire(self, timeout = None):
+        if self._available and not self._waiters:
+            obj = self._available.pop()
+            self._in_use.add(obj)
+            return obj
+
+        if self._size < self._max_size and not self._waiters:
+            self._size += 1
+            return await self._create()
+
+        if timeout is not None and timeout <= 0:
+            raise PoolTimeoutError('No objects available in the pool')
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            obj = await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            raise PoolTimeoutError(f'No object available within {timeout}s') from None
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if obj is None:
+            # Granted a free slot instead of an object
+            return await self._create()
+        return obj
+
+    def release(self, obj):
+        if obj not in self._in_use:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(obj)  # stays in _in_use
+                return
+        self._in_use.remove(obj)
+        self._available.append(obj)
+
+    @asynccontextmanager
+    async def lease(self, timeout = None):
+        obj = await self.acquire(timeout)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    async def _create(self):
+        try:
+            async with self._create_semaphore:
+                # Something may have been released while queued for a
+                # construction permit, prefer it over building a new object
+                if self._available:
+                    self._size -= 1
+                    obj = self._available.pop()
+                else:
+                    obj = self._create_instance()
+                    if inspect.isawaitable(obj):
+                        obj = await obj
+        except BaseException:
+            self._size -= 1
+            self._grant_slot()
+            raise
+
+        self._in_use.add(obj)
+        return obj
+
+    def _grant_slot(self):
+        while self._waiters and self._size < self._max_size:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._size += 1
+                waiter.set_result(None)
+                return
+
+    def _abandon(self, waiter):
+        # A timed out or cancelled waiter may already have been handed
+        # something, pass it on rather than leaking it
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+        elif waiter.done() and not waiter.cancelled():
+            obj = waiter.result()
+            if obj is None:
+                self._size -= 1
+                self._grant_slot()
+            else:
+                self.release(obj)
+
+
+class Resource:
+    created = 0
+
+    def __init__(self, resource_id):
+        self.resource_id = resource_id
+
+    def __repr__(self):
+        return f'Resource({self.resource_id})'
+
+
+async def create_resource():
+    # Stands in for opening a connection
+    await asyncio.sleep(0.05)
+    Resource.created += 1
+    print(f'Creating resource {Resource.created}')
+    return Resource(Resource.created)
+
+
+# Client Code
+if __name__ == '__main__':
+    async def handle_request(pool, request_id):
+        async with pool.lease(timeout = 2) as resource:
+            await asyncio.sleep(0.01)
+            return f'request {request_id} served by {resource}'
+
+    async def main():
+        pool = AsyncObjectPool(create_resource, max_size = 5, max_concurrent_creates = 2)
+
+        # A burst of 20 requests creates at most 5 resources, 2 at a time
+        results = await asyncio.gather(*(handle_request(pool, i) for i in range(20)))
+        for line in results[:5]:
+            print(line)
+        print(f'Resources created: {Resource.created}')
+
+        held = [await pool.acquire() for _ in range(5)]
+        try:
+            await pool.acquire(timeout = 0.1)
+        except PoolTimeoutError as e:
+            print(f'Pool exhausted: {e}')
+        for resource in held:
+            pool.release(resource)
+
+    asyncio.run(main())
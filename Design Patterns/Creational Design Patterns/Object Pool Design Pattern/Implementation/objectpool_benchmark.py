@@ -0,0 +1,45 @@
+import threading
+import time
+
+from objectpool_design_pattern import ObjectPool
+from pool_metrics import PoolMetrics
+
+
+# Contention benchmark: N threads lease from a pool smaller than N and
+# hold each object for a short simulated unit of work.
+
+class Connection:
+    pass
+
+
+def run(thread_count, pool_size = 8, ops_per_thread = 2000, hold_seconds = 0, metrics = None):
+    pool = ObjectPool(Connection, max_size = pool_size, metrics = metrics)
+    start_barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        start_barrier.wait()
+        for _ in range(ops_per_thread):
+            with pool.lease():
+                if hold_seconds:
+                    time.sleep(hold_seconds)
+
+    threads = [threading.Thread(target = worker) for _ in range(thread_count)]
+    for t in threads:
+        t.start()
+
+    start_barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return thread_count * ops_per_thread / elapsed
+
+
+if __name__ == '__main__':
+    print(f'{"threads":>8} {"ops/sec":>12} {"with metrics":>14}')
+    for thread_count in (1, 2, 4, 8, 16, 32, 64):
+        ops_per_thread = max(200, 8000 // thread_count)
+        ops = run(thread_count, ops_per_thread = ops_per_thread)
+        ops_metrics = run(thread_count, ops_per_thread = ops_per_thread, metrics = PoolMetrics())
+        print(f'{thread_count:>8} {ops:>12,.0f} {ops_metrics:>14,.0f}')
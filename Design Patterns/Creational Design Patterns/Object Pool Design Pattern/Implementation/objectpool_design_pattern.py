@@ -1,46 +1,350 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
 class Resource:
     def __init__(self):
         print('Creating a resource')
+        self.healthy = True
+
+
+class _Waiter:
+    # One waiter per blocked thread. Release hands an object (or a free
+    # creation slot) straight to the oldest waiter, so wakeups are FIFO.
+    __slots__ = ('condition', 'obj', 'granted')
+
+    def __init__(self, lock):
+        self.condition = threading.Condition(lock)
+        self.obj = None
+        self.granted = False
+
 
 class ObjectPool:
-    def __init__(self, create_instance, max_size = 10):
+    def __init__(self, create_instance, max_size = 10, min_idle = 0, max_idle = None,
+                 idle_timeout = None, housekeeping_interval = None, validate = None,
+                 destroy_instance = None, prewarm_in_background = False, metrics = None):
         self._create_instance = create_instance
         self._max_size = max_size
-        self._available = []
+
+        # Sizing policy
+        self._min_idle = min(min_idle, max_size)
+        self._max_idle = max_idle          # None keeps every released object
+        self._idle_timeout = idle_timeout  # seconds an idle object may live
+        self._validate = validate          # validate(obj) -> bool, on borrow and return
+        self._destroy_instance = destroy_instance
+
+        self._available = deque()  # (obj, idle_since), newest on the right
         self._in_use = set()
+        self._size = 0  # objects created or being created
+        self._waiters = deque()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
 
-    def acquire(self):
-        if self._available:
-            print('Picking object from available pool')
-            obj = self._available.pop()
-        elif len(self._in_use) < self._max_size:
-            obj = self._create_instance()
-        else:
-            raise Exception('No objects available in the pool')
-        
-        self._in_use.add(obj)
-        
+        self._metrics = metrics  # see pool_metrics.PoolMetrics
+        if metrics is not None:
+            metrics.track(self)
+
+        if self._min_idle:
+            if prewarm_in_background:
+                threading.Thread(target = self.prewarm, daemon = True).start()
+            else:
+                self.prewarm()
+
+        if housekeeping_interval:
+            self._housekeeper = threading.Thread(
+                target = self._housekeeping, args = (housekeeping_interval,), daemon = True)
+            self._housekeeper.start()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def in_use_count(self):
+        return len(self._in_use)
+
+    @property
+    def idle_count(self):
+        return len(self._available)
+
+    @property
+    def waiting_count(self):
+        return len(self._waiters)
+
+    def is_in_use(self, obj):
+        # True only for objects this pool handed out and has not got back
+        return obj in self._in_use
+
+    def acquire(self, timeout = None):
+        # Blocks until an object is free. timeout=None waits forever,
+        # timeout=0 fails immediately when the pool is exhausted.
+        metrics = self._metrics
+        if metrics is None:
+            return self._acquire(timeout)
+
+        start = time.perf_counter()
+        try:
+            obj = self._acquire(timeout)
+        except PoolTimeoutError:
+            metrics.increment('timeouts')
+            raise
+        metrics.on_acquire(obj, time.perf_counter() - start)
         return obj
-    
+
+    def _acquire(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            from_idle = False
+            with self._lock:
+                if self._available and not self._waiters:
+                    obj, _ = self._available.pop()  # LIFO keeps the warmest object
+                    self._in_use.add(obj)
+                    from_idle = True
+                elif self._size < self._max_size and not self._waiters:
+                    self._size += 1
+                    obj = None
+                else:
+                    obj = self._wait(deadline, timeout)
+
+            if obj is None:
+                # Reserved a creation slot, build the object outside the lock
+                return self._create()
+            # Handed-over objects were validated by release()
+            if not from_idle or self.validate(obj):
+                return obj
+            self.discard(obj)
+
     def release(self, obj):
-        if obj in self._in_use:
-            print('releasing resource')
+        with self._lock:
+            if obj not in self._in_use:
+                return
+
+        if self._metrics is not None:
+            self._metrics.on_release(obj)
+
+        if not self.validate(obj):
+            self.discard(obj)
+            return
+
+        with self._lock:
+            if self._waiters:
+                # Hand over directly, the object stays in _in_use
+                waiter = self._waiters.popleft()
+                waiter.obj = obj
+                waiter.granted = True
+                waiter.condition.notify()
+                return
+            self._in_use.discard(obj)
+            trim = self._max_idle is not None and len(self._available) >= self._max_idle
+            if trim:
+                self._size -= 1
+            else:
+                self._available.append((obj, time.monotonic()))
+
+        if trim:
+            if self._metrics is not None:
+                self._metrics.increment('evicted')
+            self._destroy(obj)
+
+    @contextmanager
+    def lease(self, timeout = None):
+        obj = self.acquire(timeout)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    def prewarm(self):
+        # Fill the idle list up to min_idle so first borrowers skip construction
+        while not self._closed.is_set():
+            with self._lock:
+                if len(self._available) >= self._min_idle or self._size >= self._max_size:
+                    return
+                self._size += 1
+
+            try:
+                obj = self._create_instance()
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                    self._grant_slot()
+                return
+
+            if self._metrics is not None:
+                self._metrics.increment('created')
+
+            with self._lock:
+                if self._waiters:
+                    waiter = self._waiters.popleft()
+                    waiter.obj = obj
+                    waiter.granted = True
+                    self._in_use.add(obj)
+                    waiter.condition.notify()
+                else:
+                    self._available.append((obj, time.monotonic()))
+
+    def evict_idle(self):
+        # Drop objects idle longer than idle_timeout, never going below min_idle
+        if self._idle_timeout is None:
+            return 0
+
+        evicted = []
+        with self._lock:
+            expired_before = time.monotonic() - self._idle_timeout
+            while (len(self._available) > self._min_idle
+                   and self._available[0][1] <= expired_before):
+                obj, _ = self._available.popleft()
+                self._size -= 1
+                evicted.append(obj)
+
+        if evicted and self._metrics is not None:
+            self._metrics.increment('evicted', len(evicted))
+        for obj in evicted:
+            self._destroy(obj)
+        return len(evicted)
+
+    def validate(self, obj):
+        # Runs the validate policy; a validator that raises counts as a failure
+        if self._validate is None:
+            return True
+        try:
+            return self._validate(obj)
+        except Exception:
+            return False
+
+    def discard(self, obj):
+        # Destroys a borrowed object instead of returning it, freeing its slot.
+        # Objects the pool does not have in use are ignored, like release().
+        with self._lock:
+            if obj not in self._in_use:
+                return
             self._in_use.remove(obj)
-            self._available.append(obj)
-    
+            self._size -= 1
+            self._grant_slot()
+        if self._metrics is not None:
+            self._metrics.increment('discarded')
+        self._destroy(obj)
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            idle = [obj for obj, _ in self._available]
+            self._available.clear()
+            self._size -= len(idle)
+        for obj in idle:
+            self._destroy(obj)
+
+    def _housekeeping(self, interval):
+        while not self._closed.wait(interval):
+            self.evict_idle()
+            self.prewarm()  # replace anything discarded since the last run
+
+    def _wait(self, deadline, timeout):
+        # Called with the lock held. Returns a handed-over object, or None
+        # when the waiter was granted a slot to create a new one.
+        if deadline is not None and deadline <= time.monotonic():
+            raise PoolTimeoutError('No objects available in the pool')
+
+        if self._metrics is not None:
+            self._metrics.increment('exhausted')
+
+        waiter = _Waiter(self._lock)
+        self._waiters.append(waiter)
+
+        while not waiter.granted:
+            if deadline is None:
+                waiter.condition.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._waiters.remove(waiter)
+                raise PoolTimeoutError(f'No object available within {timeout}s')
+            waiter.condition.wait(remaining)
+
+        return waiter.obj
+
+    def _create(self):
+        try:
+            obj = self._create_instance()
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._grant_slot()
+            raise
+
+        if self._metrics is not None:
+            self._metrics.increment('created')
+
+        with self._lock:
+            self._in_use.add(obj)
+        return obj
+
+    def _destroy(self, obj):
+        if self._destroy_instance is not None:
+            try:
+                self._destroy_instance(obj)
+            except Exception:
+                pass
+
+    def _grant_slot(self):
+        # Called with the lock held after a slot is freed without an object
+        if self._waiters and self._size < self._max_size:
+            self._size += 1
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.condition.notify()
+
+
+# Client Code
+if __name__ == '__main__':
+    pool = ObjectPool(Resource, max_size = 3)
+
+    resource1 = pool.acquire()
+    resource2 = pool.acquire()
+
+    pool.release(resource1)
 
-pool = ObjectPool(Resource, max_size = 3)
+    resource3 = pool.acquire()  # Reuses resource1
+    resource4 = pool.acquire()
 
- 
-resource1 = pool.acquire()
-resource2 = pool.acquire()
+    try:
+        pool.acquire(timeout = 0.1)
+    except PoolTimeoutError as e:
+        print(f'Pool exhausted: {e}')
 
-pool.release(resource1)
+    # A blocked acquire is woken as soon as another thread releases
+    threading.Timer(0.1, pool.release, args = (resource2,)).start()
+    resource5 = pool.acquire(timeout = 1)
+    print(resource5 is resource2)
 
-resource3 = pool.acquire()
-resource4 = pool.acquire()
+    # Lease always returns the object, even if the block raises
+    pool.release(resource3)
+    with pool.lease(timeout = 1) as resource:
+        print(f'Leased {resource}')
 
+    # Sizing policy: two objects are built up front, broken ones are
+    # discarded on borrow, idle ones beyond min_idle expire.
+    print('\nSizing policy')
+    sized_pool = ObjectPool(Resource, max_size = 5, min_idle = 2, max_idle = 3,
+                            idle_timeout = 0.2, housekeeping_interval = 0.1,
+                            validate = lambda obj: obj.healthy)
 
+    broken = sized_pool.acquire()  # Pre-warmed, no construction here
+    broken.healthy = False
+    sized_pool.release(broken)     # Discarded instead of pooled
 
+    leased = [sized_pool.acquire() for _ in range(4)]
+    for obj in leased:
+        sized_pool.release(obj)
+    print(f'Idle after release: {len(sized_pool._available)}')  # Trimmed to max_idle
 
-        
\ No newline at end of file
+    time.sleep(0.5)
+    print(f'Idle after eviction: {len(sized_pool._available)}')  # Back to min_idle
+    sized_pool.close()
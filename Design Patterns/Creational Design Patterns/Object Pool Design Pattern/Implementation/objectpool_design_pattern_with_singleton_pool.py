@@ -1,58 +1,230 @@
-def singleton(cls):
-    instances = {}
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 
-    def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
-    
-    return get_instance
+from objectpool_design_pattern import ObjectPool, PoolTimeoutError, Resource
+
+
+# A plain @singleton keyed by class returns the first ObjectPool for every
+# call, silently ignoring a different factory or max_size. The registry
+# below keeps one pool per (factory, config) instead.
+
+class _ThreadCache:
+    def __init__(self, shared_pool):
+        self.shared_pool = shared_pool
+        self.items = []  # (obj, parked_at), newest last; other threads may steal from the front
+
+    def __del__(self):
+        # Thread-local data is dropped when its thread exits, hand any
+        # parked objects back so they are not lost with the thread
+        for obj, _ in self.items:
+            self.shared_pool.release(obj)
+
+
+class ThreadCachedPool:
+    # Each thread keeps a few released objects for itself. Those are reused
+    # without touching the shared pool's lock; only misses and overflow go
+    # through the shared ObjectPool. Parked objects still count as in use
+    # there, so:
+    #   - a thread parks at most half of max_size,
+    #   - objects parked longer than max_hold go back to the shared idle
+    #     list (where validation and idle eviction apply) on the owner's
+    #     next acquire or release,
+    #   - nothing is parked while another thread is waiting, and a blocked
+    #     acquire steals from other threads' caches every max_hold seconds.
+
+    def __init__(self, create_instance, max_size = 10, local_cache_size = 4, max_hold = 0.1, **pool_options):
+        self._shared = ObjectPool(create_instance, max_size = max_size, **pool_options)
+        self._local_cache_size = min(local_cache_size, max_size // 2)
+        self._max_hold = max_hold
+        self._local = threading.local()
+        self._caches = weakref.WeakSet()  # every live thread's _ThreadCache, for stealing
+        self._caches_lock = threading.Lock()
+
+    def acquire(self, timeout = None):
+        cache = self._thread_cache()
+        items = cache.items
+        if items:
+            self._return_expired(items, time.monotonic())
+            while items:
+                try:
+                    obj, _ = items.pop()
+                except IndexError:  # stolen by a blocked thread meanwhile
+                    break
+                if self._shared.validate(obj):
+                    return obj
+                self._shared.discard(obj)
+        return self._acquire_shared(timeout)
 
-class Resource:
-    def __init__(self):
-        print('Creating a resource')
-
-
-@singleton
-class ObjectPool:
-    def __init__(self, create_instance, max_size = 10):
-        self._create_instance = create_instance
-        self._max_size = max_size
-        self._available = []
-        self._in_use = set()
-
-    def acquire(self):
-        if self._available:
-            print('Picking object from available pool')
-            obj = self._available.pop()
-        elif len(self._in_use) < self._max_size:
-            obj = self._create_instance()
-        else:
-            raise Exception('No objects available in the pool')
-        
-        self._in_use.add(obj)
-        
-        return obj
-    
     def release(self, obj):
-        if obj in self._in_use:
-            print('releasing resource')
-            self._in_use.remove(obj)
-            self._available.append(obj)
-    
+        items = self._thread_cache().items
+        now = time.monotonic()
+        if items:
+            self._return_expired(items, now)
+        # Only park objects the shared pool handed out; anything else goes to
+        # shared.release(), which ignores it
+        if (len(items) < self._local_cache_size and not self._shared.waiting_count
+                and self._shared.is_in_use(obj)
+                and all(parked is not obj for parked, _ in items)):
+            items.append((obj, now))
+        else:
+            self._shared.release(obj)
+
+    @contextmanager
+    def lease(self, timeout = None):
+        obj = self.acquire(timeout)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    def flush(self):
+        # Return this thread's parked objects to the shared pool
+        items = self._thread_cache().items
+        while items:
+            try:
+                obj, _ = items.pop()
+            except IndexError:
+                break
+            self._shared.release(obj)
+
+    @property
+    def shared_pool(self):
+        return self._shared
+
+    def _acquire_shared(self, timeout):
+        shared = self._shared
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if shared.in_use_count >= shared.max_size:
+                # Exhausted, but some of those objects may just be parked
+                obj = self._steal()
+                if obj is not None:
+                    return obj
+            wait = self._max_hold
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            try:
+                return shared.acquire(wait)
+            except PoolTimeoutError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise PoolTimeoutError(f'No object available within {timeout}s') from None
+
+    def _steal(self):
+        with self._caches_lock:
+            caches = list(self._caches)
+        for cache in caches:
+            while True:
+                try:
+                    obj, _ = cache.items.pop(0)  # the owner pops from the other end
+                except IndexError:
+                    break
+                if self._shared.validate(obj):
+                    return obj
+                self._shared.discard(obj)
+        return None
+
+    def _return_expired(self, items, now):
+        expired_before = now - self._max_hold
+        try:
+            while items[0][1] <= expired_before:
+                obj, _ = items.pop(0)
+                self._shared.release(obj)
+        except IndexError:  # emptied, possibly by a stealing thread
+            pass
+
+    def _thread_cache(self):
+        try:
+            return self._local.cache
+        except AttributeError:
+            cache = self._local.cache = _ThreadCache(self._shared)
+            with self._caches_lock:
+                self._caches.add(cache)
+            return cache
+
+
+class PoolRegistry:
+    def __init__(self):
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, create_instance, **config):
+        # Config values must be hashable, they are part of the key
+        key = (create_instance, tuple(sorted(config.items())))
+        pool = self._pools.get(key)  # lock-free once the pool exists
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = ThreadCachedPool(create_instance, **config)
+        return pool
+
+    def close_all(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.flush()
+            pool.shared_pool.close()
+
+
+# Process-wide registry
+pool_registry = PoolRegistry()
+
+
+def get_pool(create_instance, **config):
+    return pool_registry.get_pool(create_instance, **config)
+
+
+class OtherResource:
+    def __init__(self):
+        print('Creating other resource')
+
+
+# Client Code
+if __name__ == '__main__':
+    pool = get_pool(Resource, max_size = 3)
+    same_pool = get_pool(Resource, max_size = 3)
+    other_pool = get_pool(OtherResource, max_size = 50)
+
+    print(pool is same_pool)   # True
+    print(pool is other_pool)  # False, different factory and size
+
+    resource1 = pool.acquire()
+    resource2 = pool.acquire()
+
+    pool.release(resource1)
+
+    resource3 = pool.acquire()  # Reused from this thread's cache
+    print(resource3 is resource1)
 
-pool = ObjectPool(Resource, max_size = 3)
+    # Fast path versus the shared pool under contention
+    class Connection:
+        pass
 
- 
-resource1 = pool.acquire()
-resource2 = pool.acquire()
+    def run(acquire_release, thread_count = 8, ops = 20000):
+        def worker():
+            for _ in range(ops):
+                acquire_release()
 
-pool.release(resource1)
+        threads = [threading.Thread(target = worker) for _ in range(thread_count)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return thread_count * ops / (time.perf_counter() - start)
 
-resource3 = pool.acquire()
-resource4 = pool.acquire()
+    shared = ObjectPool(Connection, max_size = 16)
+    cached = get_pool(Connection, max_size = 16)
 
+    def shared_cycle():
+        shared.release(shared.acquire())
 
+    def cached_cycle():
+        cached.release(cached.acquire())
 
+    print(f'{"shared pool:":<20}{run(shared_cycle):>12,.0f} ops/sec')
+    print(f'{"thread-cached pool:":<20}{run(cached_cycle):>12,.0f} ops/sec')
 
-        
\ No newline at end of file
+    pool_registry.close_all()
@@ -0,0 +1,152 @@
+import threading
+import time
+from bisect import bisect_left
+
+
+class Histogram:
+    # Fixed buckets in seconds, same layout as a Prometheus histogram.
+    # Percentiles are estimated by interpolating inside the bucket.
+    DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                       0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.percentile(0.50),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+        }
+
+
+class PoolMetrics:
+    # Pass an instance as ObjectPool(metrics=...). A pool without metrics
+    # skips every timing call, so disabled metrics cost one None check.
+
+    COUNTERS = ('created', 'evicted', 'discarded', 'timeouts', 'exhausted')
+
+    def __init__(self, buckets = Histogram.DEFAULT_BUCKETS):
+        self.wait_time = Histogram(buckets)
+        self.hold_time = Histogram(buckets)
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self._leased_at = {}
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def track(self, pool):
+        self._pool = pool
+
+    def on_acquire(self, obj, wait_seconds):
+        with self._lock:
+            self.wait_time.observe(wait_seconds)
+            self._leased_at[id(obj)] = time.perf_counter()
+
+    def on_release(self, obj):
+        now = time.perf_counter()
+        with self._lock:
+            leased_at = self._leased_at.pop(id(obj), None)
+            if leased_at is not None:
+                self.hold_time.observe(now - leased_at)
+
+    def increment(self, counter, amount = 1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def snapshot(self):
+        with self._lock:
+            snapshot = {
+                'wait_time': self.wait_time.summary(),
+                'hold_time': self.hold_time.summary(),
+                **self.counters,
+            }
+        if self._pool is not None:
+            snapshot['in_use'] = self._pool.in_use_count
+            snapshot['idle'] = self._pool.idle_count
+            snapshot['max_size'] = self._pool.max_size
+        return snapshot
+
+    def to_prometheus(self, name = 'object_pool'):
+        lines = []
+        with self._lock:
+            for metric, histogram in (('acquire_wait_seconds', self.wait_time),
+                                      ('hold_seconds', self.hold_time)):
+                full_name = f'{name}_{metric}'
+                lines.append(f'# TYPE {full_name} histogram')
+                bounds = [*map(str, histogram.buckets), '+Inf']
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{full_name}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{full_name}_sum {histogram.sum}')
+                lines.append(f'{full_name}_count {histogram.count}')
+
+            for counter, value in self.counters.items():
+                lines.append(f'# TYPE {name}_{counter}_total counter')
+                lines.append(f'{name}_{counter}_total {value}')
+
+        if self._pool is not None:
+            for gauge, value in (('in_use', self._pool.in_use_count),
+                                 ('idle', self._pool.idle_count),
+                                 ('max_size', self._pool.max_size)):
+                lines.append(f'# TYPE {name}_{gauge} gauge')
+                lines.append(f'{name}_{gauge} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+# Client Code
+if __name__ == '__main__':
+    import random
+
+    from objectpool_design_pattern import ObjectPool, PoolTimeoutError
+
+    class Connection:
+        pass
+
+    metrics = PoolMetrics()
+    pool = ObjectPool(Connection, max_size = 4, metrics = metrics)
+
+    def worker():
+        for _ in range(50):
+            try:
+                with pool.lease(timeout = 0.05):
+                    time.sleep(random.uniform(0, 0.004))
+            except PoolTimeoutError:
+                pass
+
+    threads = [threading.Thread(target = worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for key, value in metrics.snapshot().items():
+        print(f'{key}: {value}')
+    print()
+    print(metrics.to_prometheus())
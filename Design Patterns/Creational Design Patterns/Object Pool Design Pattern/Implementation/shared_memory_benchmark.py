@@ -0,0 +1,76 @@
+import multiprocessing
+import time
+import zlib
+
+from shared_memory_buffer_pool import SharedBufferPool
+
+
+# Producer -> consumer handoff of large payloads. The queue path pickles
+# every payload through a pipe; the pool path sends only the slab index.
+# Both consumers checksum the payload so the data is actually read.
+
+def queue_consumer(queue, done):
+    checksum = 0
+    while (payload := queue.get()) is not None:
+        checksum ^= zlib.crc32(payload)
+    done.put(checksum)
+
+
+def pool_consumer(pool, queue, done):
+    checksum = 0
+    while (index := queue.get()) is not None:
+        payload = pool.payload(index)
+        checksum ^= zlib.crc32(payload)
+        payload.release()
+        pool.release(index)
+    pool.close()
+    done.put(checksum)
+
+
+def run_queue(payload, count):
+    queue, done = multiprocessing.Queue(maxsize = 8), multiprocessing.Queue()
+    worker = multiprocessing.Process(target = queue_consumer, args = (queue, done))
+    worker.start()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        queue.put(payload)
+    queue.put(None)
+    done.get()
+    elapsed = time.perf_counter() - start
+    worker.join()
+    return elapsed
+
+
+def run_pool(payload, count):
+    pool = SharedBufferPool(slab_count = 8, slab_size = len(payload))
+    queue, done = multiprocessing.Queue(), multiprocessing.Queue()
+    worker = multiprocessing.Process(target = pool_consumer, args = (pool, queue, done))
+    worker.start()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        index = pool.acquire()
+        pool.write(index, payload)
+        queue.put(index)
+    queue.put(None)
+    done.get()
+    elapsed = time.perf_counter() - start
+    worker.join()
+
+    pool.close()
+    pool.unlink()
+    return elapsed
+
+
+if __name__ == '__main__':
+    total_bytes = 512 << 20
+    print(f'{"payload":>10} {"queue MB/s":>12} {"pool MB/s":>12} {"speedup":>8}')
+    for payload_size in (64 << 10, 1 << 20, 8 << 20):
+        payload = bytes(range(256)) * (payload_size // 256)
+        count = total_bytes // payload_size
+        queue_seconds = run_queue(payload, count)
+        pool_seconds = run_pool(payload, count)
+        megabytes = total_bytes / (1 << 20)
+        print(f'{payload_size >> 10:>8}KB {megabytes / queue_seconds:>12,.0f} '
+              f'{megabytes / pool_seconds:>12,.0f} {queue_seconds / pool_seconds:>7.1f}x')
@@ -0,0 +1,151 @@
+import multiprocessing
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+from objectpool_design_pattern import PoolTimeoutError
+
+
+# Same acquire/release/lease shape as ObjectPool, but the pooled objects are
+# fixed-size slabs in one shared memory segment and the free list lives in
+# that segment too, so every process sees the same pool.
+#
+# Segment layout (8-byte ints):
+#   [top][free stack: slab_count][payload lengths: slab_count][slabs...]
+
+_INT = 8
+_ALIGN = 64
+
+
+class SharedBufferPool:
+    def __init__(self, slab_count = 64, slab_size = 1 << 20, name = None):
+        self.slab_count = slab_count
+        self.slab_size = slab_size
+        self._header_size = -(-(1 + 2 * slab_count) * _INT // _ALIGN) * _ALIGN
+
+        self._shm = shared_memory.SharedMemory(
+            name = name, create = True, size = self._header_size + slab_count * slab_size)
+        self._lock = multiprocessing.Lock()
+        self._free_slabs = multiprocessing.Semaphore(slab_count)
+        self._owner = True
+        self._attach_views()
+
+        with self._lock:
+            for index in range(slab_count):
+                self._stack[index] = slab_count - 1 - index  # slab 0 on top
+            self._top[0] = slab_count
+
+    def acquire(self, timeout = None):
+        # Returns a slab index. Blocks until one is free, like ObjectPool.acquire
+        if not self._free_slabs.acquire(timeout = timeout):
+            raise PoolTimeoutError(f'No slab available within {timeout}s')
+        with self._lock:
+            self._top[0] -= 1
+            index = self._stack[self._top[0]]
+        self._lengths[index] = 0
+        return index
+
+    def release(self, index):
+        with self._lock:
+            self._stack[self._top[0]] = index
+            self._top[0] += 1
+        self._free_slabs.release()
+
+    @contextmanager
+    def lease(self, timeout = None):
+        index = self.acquire(timeout)
+        try:
+            yield index
+        finally:
+            self.release(index)
+
+    def buffer(self, index):
+        # Writable view over the whole slab
+        start = self._header_size + index * self.slab_size
+        return self._buf[start:start + self.slab_size]
+
+    def write(self, index, data):
+        size = len(data)
+        if size > self.slab_size:
+            raise ValueError(f'Payload of {size} bytes does not fit a {self.slab_size} byte slab')
+        self.buffer(index)[:size] = data
+        self._lengths[index] = size
+
+    def set_length(self, index, size):
+        # For producers that fill buffer(index) in place
+        self._lengths[index] = size
+
+    def payload(self, index):
+        # Zero-copy view of what the producer wrote
+        start = self._header_size + index * self.slab_size
+        return self._buf[start:start + self._lengths[index]]
+
+    def close(self):
+        # Views into the segment must be released before it can be closed
+        for view in (self._top, self._stack, self._lengths, self._buf):
+            view.release()
+        self._shm.close()
+
+    def unlink(self):
+        if self._owner:
+            self._shm.unlink()
+
+    def __getstate__(self):
+        # Only used when processes are spawned rather than forked
+        return {
+            'slab_count': self.slab_count,
+            'slab_size': self.slab_size,
+            '_header_size': self._header_size,
+            'name': self._shm.name,
+            '_lock': self._lock,
+            '_free_slabs': self._free_slabs,
+        }
+
+    def __setstate__(self, state):
+        name = state.pop('name')
+        self.__dict__.update(state)
+        # Processes started by multiprocessing share the parent's resource
+        # tracker, so attaching here does not take ownership of the segment
+        self._shm = shared_memory.SharedMemory(name = name)
+        self._owner = False
+        self._attach_views()
+
+    def _attach_views(self):
+        self._buf = self._shm.buf
+        header = self._buf[:(1 + 2 * self.slab_count) * _INT].cast('q')
+        self._top = header[:1]
+        self._stack = header[1:1 + self.slab_count]
+        self._lengths = header[1 + self.slab_count:]
+        header.release()
+
+
+def consumer(pool, queue):
+    # Receives slab indexes and reads the payload in place
+    while True:
+        index = queue.get()
+        if index is None:
+            break
+        payload = pool.payload(index)
+        print(f'consumer read {len(payload)} bytes: {bytes(payload[:11])}')
+        payload.release()
+        pool.release(index)
+    pool.close()
+
+
+# Client Code
+if __name__ == '__main__':
+    pool = SharedBufferPool(slab_count = 4, slab_size = 4096)
+    queue = multiprocessing.Queue()
+
+    worker = multiprocessing.Process(target = consumer, args = (pool, queue))
+    worker.start()
+
+    for i in range(8):
+        index = pool.acquire(timeout = 5)  # Blocks until the consumer frees a slab
+        pool.write(index, f'hello slab {index} message {i}'.encode())
+        queue.put(index)  # Only the index crosses the process boundary
+
+    queue.put(None)
+    worker.join()
+
+    pool.close()
+    pool.unlink()
@@ -14,11 +14,10 @@ class Student(Prototype):
     def __str__(self):
         return f'id: {id(self)}, Name: {self.name}, Age: {self.age}, Roll No: {self.__roll_no}'
 
-student = Student('Anil', 50, 'S0001')
+if __name__ == '__main__':
+    student = Student('Anil', 50, 'S0001')
 
-cloned_student  = student.get_clone()
+    cloned_student  = student.get_clone()
 
-print(student)
-print(cloned_student)
-
-        
\ No newline at end of file
+    print(student)
+    print(cloned_student)
@@ -0,0 +1,81 @@
+import copy
+import random
+import time
+
+from prototype_copy_on_write import CowPrototype
+
+
+# Clones a template with several large nested attributes and changes one
+# field per clone, comparing copy.copy, copy.deepcopy and copy-on-write.
+# The read columns also scan every row of the clone without changing it.
+
+class Template(CowPrototype):
+    __immutable__ = ('schema',)
+
+    def __init__(self, rows, lookup, schema, tags):
+        self.name = 'template'
+        self.rows = rows      # list of dicts
+        self.lookup = lookup  # dict of lists
+        self.schema = schema  # read-only metadata
+        self.tags = tags
+
+
+def make_template(row_count):
+    rng = random.Random(1)
+    rows = [{'id': i, 'price': rng.random(), 'tags': ['a', 'b'], 'dims': [1, 2, 3]} for i in range(row_count)]
+    lookup = {f'key{i}': [rng.randint(0, 100) for _ in range(10)] for i in range(row_count // 2)}
+    schema = {f'col{i}': {'type': 'float', 'nullable': True} for i in range(50)}
+    return Template(rows, lookup, schema, ['x', 'y'])
+
+
+# The copy module baselines copy the attribute dict: copying the object
+# itself would also copy CowPrototype's sharing bookkeeping.
+
+def shallow_clone(template):
+    clone = copy.copy(template.__dict__)
+    clone['tags'] = clone['tags'] + ['edited']
+    return clone
+
+
+def deep_clone(template):
+    clone = copy.deepcopy(template.__dict__)
+    clone['tags'].append('edited')
+    return clone
+
+
+def cow_clone(template):
+    clone = template.clone()
+    clone.tags.append('edited')  # only tags gets copied
+    return clone
+
+
+def deep_clone_read(template):
+    clone = copy.deepcopy(template.__dict__)
+    return sum(row['price'] for row in clone['rows'])
+
+
+def cow_clone_read(template):
+    clone = template.clone()
+    return sum(row['price'] for row in clone.rows)  # reads through views, copies nothing
+
+
+def clones_per_second(clone, template, seconds = 0.5):
+    count = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(10):
+            clone(template)
+        count += 10
+    return count / elapsed
+
+
+if __name__ == '__main__':
+    print(f'{"rows":>6} {"copy.copy":>12} {"deepcopy":>12} {"cow":>12} {"deep+read":>12} {"cow+read":>12}   clones/sec')
+    for row_count in (10, 100, 1000, 10_000):
+        template = make_template(row_count)
+        shallow = clones_per_second(shallow_clone, template)
+        deep = clones_per_second(deep_clone, template)
+        cow = clones_per_second(cow_clone, make_template(row_count))
+        deep_read = clones_per_second(deep_clone_read, template)
+        cow_read = clones_per_second(cow_clone_read, make_template(row_count))
+        print(f'{row_count:>6} {shallow:>12,.0f} {deep:>12,.0f} {cow:>12,.0f} {deep_read:>12,.0f} {cow_read:>12,.0f}')
@@ -0,0 +1,360 @@
+import copy
+from collections.abc import MutableMapping, MutableSequence, MutableSet
+
+
+# Copy-on-write clone. The first clone() takes one deep copy of the
+# prototype's mutable attributes (its snapshot) and every later clone shares
+# it, so each clone copies nothing up front. The prototype itself is left
+# as it was. A clone reading a shared list, dict or set gets a view that
+# reads through to the snapshot; the first write through it (or through any
+# view taken from it) deep-copies that attribute into the clone. Every
+# instance copies with one deepcopy memo, so two attributes that alias each
+# other stay aliased. Other mutable values are copied on first access.
+# Attributes listed in __immutable__, and values of immutable builtin types,
+# are shared by reference forever.
+
+_IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, type(None), frozenset)
+
+
+_ATOMIC = frozenset(_IMMUTABLE_TYPES)  # exact types, for a set lookup on hot paths
+
+
+def _is_immutable(value):
+    if type(value) in _ATOMIC:
+        return True
+    if type(value) is tuple:
+        return all(map(_is_immutable, value))
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+class _CowView:
+    # Read-only methods run on the shared value; any other method or
+    # operator first copies the attribute and then runs on the copy.
+    __slots__ = ('_owner', '_name', '_value')
+    _read_only = frozenset()
+
+    def __init__(self, owner, name, value):
+        self._owner = owner
+        self._name = name  # the attribute this value was reached from
+        self._value = value
+
+    def _read(self):
+        value = self._value
+        return self._owner._cow_memo.get(id(value), value)
+
+    def _write(self):
+        return self._owner._cow_own(self._name, self._value)
+
+    def _wrap(self, target, item):
+        if target is not self._value or type(item) in _ATOMIC:
+            return item  # target is already the owner's own copy, or item can't change
+        return self._owner._cow_wrap(self._name, item)
+
+    def __getattr__(self, method):
+        if method in self._read_only:
+            return getattr(self._read(), method)
+        return getattr(self._write(), method)
+
+    def __len__(self):
+        return len(self._read())
+
+    def __bool__(self):
+        return bool(self._read())
+
+    def __contains__(self, item):
+        return item in self._read()
+
+    def __iter__(self):
+        target = self._read()
+        if target is not self._value:
+            yield from target
+            return
+        wrap, name = self._owner._cow_wrap, self._name
+        for item in target:
+            yield item if type(item) in _ATOMIC else wrap(name, item)
+
+    def __getitem__(self, key):
+        target = self._read()
+        if isinstance(key, slice):
+            return [self._wrap(target, item) for item in target[key]]
+        return self._wrap(target, target[key])
+
+    def __setitem__(self, key, value):
+        self._write()[key] = value
+
+    def __delitem__(self, key):
+        del self._write()[key]
+
+    # Operators that build a new container work on a shallow copy whose
+    # mutable items are views too, so the result can't reach the shared value
+    def __add__(self, other):
+        return self._shallow() + _unwrap(other)
+
+    def __radd__(self, other):
+        return _unwrap(other) + self._shallow()
+
+    def __mul__(self, count):
+        return self._shallow() * count
+
+    __rmul__ = __mul__
+
+    def __or__(self, other):
+        return self._shallow() | _unwrap(other)
+
+    def __ror__(self, other):
+        return _unwrap(other) | self._shallow()
+
+    def __and__(self, other):
+        return self._shallow() & _unwrap(other)
+
+    __rand__ = __and__
+
+    def __sub__(self, other):
+        return self._shallow() - _unwrap(other)
+
+    def __rsub__(self, other):
+        return _unwrap(other) - self._shallow()
+
+    def __xor__(self, other):
+        return self._shallow() ^ _unwrap(other)
+
+    __rxor__ = __xor__
+
+    def __iadd__(self, other):
+        target = self._write()
+        target += other
+        return target
+
+    def __imul__(self, count):
+        target = self._write()
+        target *= count
+        return target
+
+    def __ior__(self, other):
+        target = self._write()
+        target |= other
+        return target
+
+    def __iand__(self, other):
+        target = self._write()
+        target &= other
+        return target
+
+    def __isub__(self, other):
+        target = self._write()
+        target -= other
+        return target
+
+    def __ixor__(self, other):
+        target = self._write()
+        target ^= other
+        return target
+
+    def __eq__(self, other):
+        return self._read() == _unwrap(other)
+
+    def __lt__(self, other):
+        return self._read() < _unwrap(other)
+
+    def __le__(self, other):
+        return self._read() <= _unwrap(other)
+
+    def __gt__(self, other):
+        return self._read() > _unwrap(other)
+
+    def __ge__(self, other):
+        return self._read() >= _unwrap(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._read())
+
+
+def _unwrap(value):
+    return value._read() if isinstance(value, _CowView) else value
+
+
+class _ListView(_CowView):
+    __slots__ = ()
+    _read_only = frozenset(('count', 'index'))
+
+    def _shallow(self):
+        return list(self)
+
+    def __reversed__(self):
+        target = self._read()
+        for item in reversed(target):
+            yield self._wrap(target, item)
+
+
+class _DictView(_CowView):
+    __slots__ = ()
+    _read_only = frozenset(('keys',))
+
+    def __iter__(self):
+        return iter(self._read())  # keys are hashable, nothing to protect
+
+    def _shallow(self):
+        return dict(self.items())
+
+    def get(self, key, default = None):
+        target = self._read()
+        return self._wrap(target, target[key]) if key in target else default
+
+    def values(self):
+        target = self._read()
+        return [self._wrap(target, value) for value in target.values()]
+
+    def items(self):
+        target = self._read()
+        return [(key, self._wrap(target, value)) for key, value in target.items()]
+
+
+class _SetView(_CowView):
+    __slots__ = ()
+    _read_only = frozenset(('isdisjoint', 'issubset', 'issuperset', 'union', 'intersection',
+                            'difference', 'symmetric_difference'))
+
+    def _shallow(self):
+        return set(self._read())  # items are hashable, nothing to protect
+
+
+# Views aren't list/dict/set subclasses, but they do pass the abc checks
+MutableSequence.register(_ListView)
+MutableMapping.register(_DictView)
+MutableSet.register(_SetView)
+
+_VIEWS = {list: _ListView, dict: _DictView, set: _SetView}
+
+
+_COW_STATE = ('_cow_shared', '_cow_memo', '_cow_snapshot')
+
+
+class CowPrototype:
+    __immutable__ = ()  # attribute names that are never mutated after creation
+
+    def clone(self, **overrides):
+        snapshot = self._cow_snapshot_state()
+        clone_state = {name: value for name, value in self.__dict__.items()
+                       if name not in _COW_STATE and name not in snapshot}
+        clone_state.update(overrides)
+        clone_state['_cow_shared'] = {name: value for name, value in snapshot.items() if name not in overrides}
+        clone_state['_cow_memo'] = {}  # id(shared object) -> this instance's copy
+        clone = object.__new__(type(self))
+        clone.__dict__.update(clone_state)
+        return clone
+
+    def refresh_snapshot(self):
+        # Call after changing this instance's containers in place, so later
+        # clones see the change. Assigning an attribute does this already.
+        self.__dict__.pop('_cow_snapshot', None)
+
+    def _cow_snapshot_state(self):
+        # name -> read-only value for every mutable attribute, taken once and
+        # shared by all clones until this instance changes
+        state = self.__dict__
+        snapshot = state.get('_cow_snapshot')
+        if snapshot is not None:
+            return snapshot
+
+        shared = state.get('_cow_shared')
+        if shared and state['_cow_memo']:
+            # Copies were taken and may alias values that are still shared;
+            # copy the rest with the same memo
+            for name in list(shared):
+                self._cow_materialize(name)
+        snapshot = dict(shared or ())  # already read-only
+        owned = {name: value for name, value in state.items()
+                 if name not in _COW_STATE and name not in self.__immutable__ and not _is_immutable(value)}
+        snapshot.update(copy.deepcopy(owned))  # one call, so aliases between them survive
+        state['_cow_snapshot'] = snapshot
+        return snapshot
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. for attributes that are
+        # still shared. Once copied they live in __dict__ and cost nothing
+        # extra.
+        shared = self.__dict__.get('_cow_shared')
+        if not shared or name not in shared:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        return self._cow_wrap(name, shared[name])
+
+    def __setattr__(self, name, value):
+        if isinstance(value, _CowView):
+            value = value._write()  # keep the alias: both names share one copy
+        shared = self.__dict__.get('_cow_shared')
+        if shared:
+            shared.pop(name, None)
+        self.__dict__.pop('_cow_snapshot', None)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        shared = self.__dict__.get('_cow_shared')
+        self.__dict__.pop('_cow_snapshot', None)
+        if shared and name in shared:
+            del shared[name]
+        else:
+            object.__delattr__(self, name)
+
+    def is_shared(self, name):
+        shared = self.__dict__.get('_cow_shared')
+        return bool(shared) and name in shared
+
+    def _cow_wrap(self, name, value):
+        # What a read of a shared value (reached through attribute name) returns
+        own = self._cow_memo.get(id(value))
+        if own is not None:
+            return own  # already copied through an alias
+        view = _VIEWS.get(type(value))
+        if view is not None:
+            return view(self, name, value)
+        if _is_immutable(value):
+            return value
+        return self._cow_own(name, value)
+
+    def _cow_own(self, name, value):
+        # This instance's copy of value, copying the attribute if needed.
+        # Called for every write through a view, so it also drops the snapshot.
+        self.__dict__.pop('_cow_snapshot', None)
+        self._cow_materialize(name)
+        own = self._cow_memo.get(id(value))
+        if own is None:
+            raise RuntimeError(f'stale copy-on-write view of {name!r}: its owner was cloned after it was taken')
+        return own
+
+    def _cow_materialize(self, name):
+        shared = self.__dict__['_cow_shared']
+        if name in shared:
+            self.__dict__[name] = copy.deepcopy(shared.pop(name), self._cow_memo)
+
+
+class ReportTemplate(CowPrototype):
+    __immutable__ = ('layout',)
+
+    def __init__(self, title, layout, sections, styles):
+        self.title = title
+        self.layout = layout      # large, read-only, always shared
+        self.sections = sections  # copied only by the clone that touches it
+        self.styles = styles
+
+
+# Client Code
+if __name__ == '__main__':
+    template = ReportTemplate(
+        title = 'Quarterly Report',
+        layout = {'columns': 2, 'margins': [20, 20, 20, 20]},
+        sections = [{'heading': 'Summary', 'rows': list(range(1000))}],
+        styles = {'font': 'Arial', 'colors': ['black', 'gray']},
+    )
+
+    report = template.clone(title = 'Q3 Report')
+    report.sections.append({'heading': 'Q3 numbers', 'rows': []})  # copies sections only
+
+    print(len(template.sections), len(report.sections))  # 1 2
+    print(report.layout is template.layout)               # True, declared immutable
+    print(report.styles['colors'][0])                      # black, read through a view
+    print(report.is_shared('styles'))                      # True, reading copied nothing
+
+    report.styles['colors'].append('blue')                 # now styles is copied
+    print(template.styles['colors'], report.styles['colors'])
@@ -0,0 +1,139 @@
+import gc
+import os
+import sys
+from itertools import repeat
+from operator import setitem
+
+from prototype_copy_on_write import CowPrototype, ReportTemplate
+
+
+# Named prototypes with bulk cloning. A clone is made by copying the
+# prototype's attribute dict into a bare instance, so __init__ (and any
+# get_clone() that calls it) never runs per clone. Clones are shallow,
+# like copy.copy: mutable attributes are shared unless overridden.
+# CowPrototype prototypes are cloned through their own clone() instead, so
+# each clone copies on write.
+
+class Column:
+    # Marks an override as one value per clone rather than one for all.
+    # Accepts any sequence: list, tuple, range, array.array, numpy array.
+    def __init__(self, values):
+        self.values = values.tolist() if hasattr(values, 'tolist') else list(values)
+
+    def __len__(self):
+        return len(self.values)
+
+
+class PrototypeRegistry:
+    def __init__(self):
+        self._prototypes = {}
+
+    def register(self, name, prototype):
+        self._prototypes[name] = prototype
+
+    def unregister(self, name):
+        self._prototypes.pop(name, None)
+
+    def names(self):
+        return list(self._prototypes)
+
+    def clone(self, name, /, **overrides):
+        return self.clone_many(name, 1, overrides)[0]
+
+    def clone_many(self, name, n, overrides = None):
+        prototype = self._prototypes[name]
+        cls = type(prototype)
+        if isinstance(prototype, CowPrototype):
+            # Its __dict__ holds sharing bookkeeping that must not be shared
+            # between clones, so let the prototype make each one
+            attributes = {key for key in prototype.__dict__ if not key.startswith('_cow_')}
+            attributes.update(prototype.__dict__.get('_cow_shared', ()))
+            values, columns = self._split_overrides(cls, attributes, n, overrides)
+            clones = [prototype.clone(**values) for _ in range(n)]
+            for attribute, column in columns.items():
+                for clone, value in zip(clones, column):
+                    setattr(clone, attribute, value)
+            return clones
+
+        template = dict(prototype.__dict__)
+        values, columns = self._split_overrides(cls, template, n, overrides)
+        template.update(values)
+
+        # map() keeps the per-clone loops in C: copy the template dict,
+        # fill in each column, then attach the dicts to bare instances
+        # Nothing created here can form a cycle, so pause the cyclic GC
+        # instead of letting it rescan the growing batch
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            states = list(map(dict.copy, repeat(template, n)))
+            for attribute, column in columns.items():
+                list(map(setitem, states, repeat(attribute, n), column))
+
+            clones = list(map(object.__new__, repeat(cls, n)))
+            for clone, state in zip(clones, states):
+                clone.__dict__ = state
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return clones
+
+    def _split_overrides(self, cls, attributes, n, overrides):
+        # -> ({attribute: value for every clone}, {attribute: per-clone values})
+        values = {}
+        columns = {}
+        for key, value in (overrides or {}).items():
+            attribute = self._attribute_name(cls, attributes, key)
+            if isinstance(value, Column):
+                if len(value) != n:
+                    raise ValueError(f'Column {key!r} has {len(value)} values, expected {n}')
+                columns[attribute] = value.values
+            else:
+                values[attribute] = value
+        return values, columns
+
+    @staticmethod
+    def _attribute_name(cls, attributes, key):
+        # Lets callers override private attributes by their plain name,
+        # e.g. 'roll_no' for Student's name-mangled __roll_no. Unknown keys
+        # are refused, so a typo can't add a new attribute to every clone.
+        if key in attributes:
+            return key
+        for klass in cls.__mro__:
+            mangled = f'_{klass.__name__.lstrip("_")}__{key}'
+            if mangled in attributes:
+                return mangled
+        raise AttributeError(f'{cls.__name__!r} prototype has no attribute {key!r}')
+
+
+# Client Code
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'explanation'))
+    from student_prototype import Student
+
+    registry = PrototypeRegistry()
+    registry.register('first-year', Student('Template', 18, 'S0000'))
+    registry.register('exchange', Student('Template', 21, 'X0000'))
+
+    single = registry.clone('exchange', name = 'Lena')
+    print(single)
+
+    batch = registry.clone_many('first-year', 5, overrides = {
+        'name': Column(['Anil', 'Bela', 'Chen', 'Dev', 'Esha']),
+        'roll_no': Column(f'S{i:04d}' for i in range(1, 6)),
+        'age': 19,
+    })
+    for student in batch:
+        print(student)
+
+    # Copy-on-write prototypes: each clone gets its own sharing state, so a
+    # write through one clone leaves the others and the prototype intact
+    template = ReportTemplate('Quarterly Report', {'columns': 2}, [1, 2, 3], {'font': 'Arial'})
+    template.clone()
+    registry.register('report', template)
+    first, second = registry.clone_many('report', 2)
+    first.sections.append(4)
+    print(first.sections, second.sections, template.sections)  # [1, 2, 3, 4] [1, 2, 3] [1, 2, 3]
+
+    drafts = registry.clone_many('report', 2, overrides = {'sections': Column([[], ['intro']])})
+    print([draft.sections for draft in drafts])
@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from prototype_registry import Column, PrototypeRegistry
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'explanation'))
+from student_prototype import Student
+
+
+# Clones per second: Student.get_clone() in a loop (one __init__ per clone)
+# against PrototypeRegistry.clone_many with scalar and column overrides.
+
+def get_clone_loop(prototype, n, names, roll_numbers):
+    clones = []
+    for i in range(n):
+        clone = prototype.get_clone()
+        clone.name = names[i]
+        clone._Student__roll_no = roll_numbers[i]
+        clones.append(clone)
+    return clones
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    prototype = Student('Template', 18, 'S0000')
+    registry = PrototypeRegistry()
+    registry.register('student', prototype)
+
+    print(f'{"clones":>9} {"get_clone loop":>15} {"clone_many":>12} {"+ columns":>12}   clones/sec')
+    for n in (10_000, 100_000, 500_000):
+        names = [f'student{i}' for i in range(n)]
+        roll_numbers = np.arange(n)
+
+        loop = timed(get_clone_loop, prototype, n, names, roll_numbers.tolist())
+        plain = timed(registry.clone_many, 'student', n, {'age': 19})
+        columns = timed(registry.clone_many, 'student', n,
+                        {'age': 19, 'name': Column(names), 'roll_no': Column(roll_numbers)})
+
+        print(f'{n:>9,} {n / loop:>15,.0f} {n / plain:>12,.0f} {n / columns:>12,.0f}')
@@ -13,7 +13,8 @@ class Singleton:
 
         return cls._instance
 
-s1 = Singleton.get_instance()
-s2 = Singleton.get_instance()
+if __name__ == '__main__':
+    s1 = Singleton.get_instance()
+    s2 = Singleton.get_instance()
 
-print(s1 is s2)
+    print(s1 is s2)
@@ -18,10 +18,11 @@ def test_singleton():
     print(f"Instance: {id(s)}")
 
 
-threads = [threading.Thread(target = test_singleton) for _ in range(5)]
+if __name__ == '__main__':
+    threads = [threading.Thread(target = test_singleton) for _ in range(5)]
 
-for t in threads:
-    t.start()
+    for t in threads:
+        t.start()
 
-for t in threads:
-    t.join()
\ No newline at end of file
+    for t in threads:
+        t.join()
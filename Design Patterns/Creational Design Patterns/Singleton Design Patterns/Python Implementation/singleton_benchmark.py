@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import threading
+import time
+
+
+# Throughput of repeated singleton lookups once the instance exists, for
+# every variant in this folder, with 1 to 64 threads.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load(file_name):
+    # The example files have spaces in their names, so import them by path
+    path = os.path.join(HERE, file_name)
+    module_name = os.path.splitext(file_name)[0].replace(' ', '_')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def variants():
+    eager = load('singleton using eager initialization.py').Singleton
+    lazy = load('singleton using lazy initialization.py').Singleton
+    locked = load('singleton using thread safety.py').Singleton
+    decorated = load('singleton_decorator.py').Logger
+    double_checked = load('singleton_double_checked_locking.py').SingletonMeta
+
+    class DoubleChecked(metaclass = double_checked):
+        pass
+
+    return {
+        '__new__ check': eager,
+        'get_instance()': lazy.get_instance,
+        'lock every call': locked,
+        'decorator': decorated,
+        'double-checked': DoubleChecked,
+    }
+
+
+def run(get_instance, thread_count, calls_per_thread):
+    get_instance()  # measure steady state, not first creation
+    start_barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        start_barrier.wait()
+        for _ in range(calls_per_thread):
+            get_instance()
+
+    threads = [threading.Thread(target = worker) for _ in range(thread_count)]
+    for t in threads:
+        t.start()
+
+    start_barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return thread_count * calls_per_thread / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    thread_counts = (1, 2, 4, 8, 16, 32, 64)
+    total_calls = 400_000
+
+    print('calls/sec (millions)')
+    print(f'{"variant":<18}' + ''.join(f'{n:>8}' for n in thread_counts))
+    for name, get_instance in variants().items():
+        row = [run(get_instance, n, total_calls // n) / 1e6 for n in thread_counts]
+        print(f'{name:<18}' + ''.join(f'{ops:>8.2f}' for ops in row))
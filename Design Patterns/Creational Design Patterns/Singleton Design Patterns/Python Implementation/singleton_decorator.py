@@ -17,12 +17,12 @@ class Logger:
     def error(self, error_stack):
         print(f'Logger error: {error_stack}')
 
-log1 = Logger()
+if __name__ == '__main__':
+    log1 = Logger()
 
-log2 = Logger()
+    log2 = Logger()
 
-print(id(log1))
-print(id(log2))
-
-print(log1 is log2)
+    print(id(log1))
+    print(id(log2))
 
+    print(log1 is log2)
@@ -0,0 +1,51 @@
+import threading
+import time
+
+
+class SingletonMeta(type):
+    # Double-checked locking. Once the instance exists every call is a plain
+    # attribute read; the lock is only taken while the instance is missing.
+    # Creating it through type.__call__ inside the lock means __new__ and
+    # __init__ both run exactly once.
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._instance = None  # each subclass gets its own instance
+        cls._instance_lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instance = instance  # publish only after __init__ finished
+        return instance
+
+
+class Configuration(metaclass = SingletonMeta):
+    init_calls = 0
+
+    def __init__(self):
+        # Simulates loading settings, long enough for threads to race
+        time.sleep(0.05)
+        Configuration.init_calls += 1
+        self.settings = {'env': 'production'}
+
+
+# Client Code
+if __name__ == '__main__':
+    instances = []
+
+    def get_configuration():
+        instances.append(Configuration())
+
+    threads = [threading.Thread(target = get_configuration) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f'Distinct instances: {len({id(obj) for obj in instances})}')  # 1
+    print(f'__init__ calls: {Configuration.init_calls}')                  # 1
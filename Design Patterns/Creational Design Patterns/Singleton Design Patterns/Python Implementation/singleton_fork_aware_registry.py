@@ -0,0 +1,138 @@
+import os
+import tempfile
+import threading
+import time
+
+
+class SingletonRegistry:
+    # Like the @singleton decorator, but a forked child does not inherit the
+    # parent's instances: each process creates its own on first use.
+
+    def __init__(self):
+        self._instances = {}  # class -> instance
+        self._init_seconds = {}  # class -> construction time in this process
+        self._inherited = []
+        self._inherited_init_seconds = 0.0
+        # One lock per class is held while it is constructed, so an __init__
+        # may use other registry singletons. self._lock only guards the dicts
+        # and is never held while user code runs.
+        self._class_locks = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        if hasattr(os, 'register_at_fork'):
+            # Hold the dict lock across fork so the child never copies it
+            # mid-update. It is only held briefly, so a slow constructor in
+            # another thread does not delay fork(); the child starts with
+            # fresh class locks since it drops every instance anyway.
+            # Lambdas, because the child swaps in a fresh lock.
+            os.register_at_fork(before = lambda: self._lock.acquire(),
+                                after_in_parent = lambda: self._lock.release(),
+                                after_in_child = self._after_fork_in_child)
+
+    def singleton(self, cls):
+        def get_instance(*args, **kwargs):
+            return self.get(cls, *args, **kwargs)
+
+        get_instance.cls = cls
+        return get_instance
+
+    def get(self, cls, *args, **kwargs):
+        instance = self._instances.get(cls)
+        if instance is None:
+            with self._class_lock(cls):
+                instance = self._instances.get(cls)
+                if instance is None:
+                    start = time.perf_counter()
+                    instance = cls(*args, **kwargs)
+                    with self._lock:
+                        self._init_seconds[cls] = time.perf_counter() - start
+                        self._instances[cls] = instance
+        return instance
+
+    def _class_lock(self, cls):
+        lock = self._class_locks.get(cls)
+        if lock is None:
+            with self._lock:
+                lock = self._class_locks.setdefault(cls, threading.Lock())
+        return lock
+
+    def reset(self, cls = None):
+        # For tests: forget one class, or every instance when cls is None
+        cls = getattr(cls, 'cls', cls)  # accept the decorated name too
+        with self._lock:
+            if cls is None:
+                self._instances.clear()
+                self._init_seconds.clear()
+            else:
+                self._instances.pop(cls, None)
+                self._init_seconds.pop(cls, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pid': self._pid,
+                'instances': [cls.__name__ for cls in self._instances],
+                'init_seconds': {cls.__name__: seconds for cls, seconds in self._init_seconds.items()},
+                'init_seconds_total': sum(self._init_seconds.values()),
+                # warm state the parent had built and this process had to drop
+                'lost_at_fork_seconds': self._inherited_init_seconds,
+            }
+
+    def _after_fork_in_child(self):
+        # Keep the parent's objects referenced instead of letting them be
+        # garbage collected here: their finalizers would flush or close
+        # file handles and locks that still belong to the parent.
+        self._inherited.extend(self._instances.values())
+        self._inherited_init_seconds = sum(self._init_seconds.values())
+        self._instances = {}
+        self._init_seconds = {}
+        self._class_locks = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+
+registry = SingletonRegistry()
+singleton = registry.singleton
+
+
+@singleton
+class Logger:
+    def __init__(self, path):
+        time.sleep(0.1)  # stands in for opening sinks, loading config
+        self.pid = os.getpid()
+        self.file = open(path, 'a')
+        self.lock = threading.Lock()
+
+    def info(self, message):
+        with self.lock:
+            self.file.write(f'[{self.pid}] info: {message}\n')
+            self.file.flush()
+
+
+# Client Code
+if __name__ == '__main__':
+    log_path = os.path.join(tempfile.gettempdir(), 'fork_aware_singleton.log')
+
+    parent_logger = Logger(log_path)
+    parent_logger.info('parent started')
+    print(f'parent: {registry.stats()}')
+
+    if hasattr(os, 'fork'):
+        workers = []
+        for _ in range(2):
+            pid = os.fork()
+            if pid == 0:
+                child_logger = Logger(log_path)  # created fresh in the worker
+                child_logger.info('worker started')
+                print(f'worker owns a new logger: {child_logger is not parent_logger}')
+                print(f'worker: {registry.stats()}')
+                os._exit(0)
+            workers.append(pid)
+        for pid in workers:
+            os.waitpid(pid, 0)
+
+    print(f'parent still uses its logger: {Logger(log_path) is parent_logger}')
+
+    registry.reset(Logger)
+    print(f'after reset: {registry.stats()["instances"]}')
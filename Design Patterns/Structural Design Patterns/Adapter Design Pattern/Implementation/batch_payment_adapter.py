@@ -0,0 +1,180 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from payment_adapter import NewPaymentGateway, OldPaymentGateway
+
+
+class PaymentDeclinedError(Exception):
+    pass
+
+
+class IdempotencyConflictError(ValueError):
+    pass
+
+
+class SlowOldPaymentGateway(OldPaymentGateway):
+    # Stand-in for the real legacy gateway: blocks for a while per call and
+    # declines a fraction of payments. Counts the calls it actually received.
+    def __init__(self, latency = 0.02, jitter = 0.01, failure_rate = 0.0, seed = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def process_payment(self, amount):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            declined = self._random.random() < self.failure_rate
+        time.sleep(delay)
+        if declined:
+            raise PaymentDeclinedError(f'Payment of ${amount} declined')
+        return super().process_payment(amount)
+
+
+class IdempotencyCache:
+    # idempotency key -> (request, Future of the first attempt). A retry
+    # with the same key and request gets that future (still running or
+    # finished) instead of charging again; the same key with a different
+    # request is rejected. Entries expire `ttl` seconds after they were added; since the ttl
+    # is the same for all of them, insertion order is expiry order and a deque
+    # is enough to evict. Failed attempts are dropped so they can be retried.
+
+    def __init__(self, ttl = 600.0, clock = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = {}
+        self._expiry = deque()  # (expires_at, key)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_submit(self, key, request, submit):
+        # Returns (future, deduplicated). request is anything comparable that
+        # identifies what is being done, e.g. the amount.
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] != request:
+                    raise IdempotencyConflictError(
+                        f'Idempotency key {key!r} was already used for {entry[1]!r}, not {request!r}')
+                return entry[2], True
+            future = submit()
+            self._entries[key] = (now + self.ttl, request, future)
+            self._expiry.append((now + self.ttl, key))
+        future.add_done_callback(lambda done: self._forget_failure(key, done))
+        return future, False
+
+    def _forget_failure(self, key, future):
+        if future.exception() is None:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is future:
+                del self._entries[key]
+
+    def _evict(self, now):
+        expiry, entries = self._expiry, self._entries
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = expiry.popleft()
+            entry = entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del entries[key]
+
+
+class PaymentResult:
+    def __init__(self, key, amount, response = None, error = None, deduplicated = False, latency = 0.0):
+        self.key = key
+        self.amount = amount
+        self.response = response
+        self.error = error
+        self.deduplicated = deduplicated  # answered from an earlier attempt with the same key
+        self.latency = latency  # seconds from batch submission to this item's answer
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'failed: {self.error}'
+        return f'PaymentResult({self.key!r}, ${self.amount}, {status}{", deduplicated" if self.deduplicated else ""})'
+
+
+class BatchPaymentAdapter(NewPaymentGateway):
+    # Runs batches of payments against the blocking legacy gateway on a
+    # bounded thread pool (max_workers calls in flight at most), with
+    # retries deduplicated through an IdempotencyCache.
+
+    def __init__(self, old_gateway, max_workers = 16, idempotency_ttl = 600.0):
+        self.old_gateway = old_gateway
+        self.cache = IdempotencyCache(idempotency_ttl)
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix = 'payment')
+
+    def make_payment(self, amount, idempotency_key = None):
+        if idempotency_key is None:
+            return self.old_gateway.process_payment(amount)
+        result, = self.make_payments([(idempotency_key, amount)])
+        if not result.ok:
+            raise result.error
+        return result.response
+
+    def make_payments(self, payments):
+        # payments: iterable of (idempotency_key, amount). Returns one
+        # PaymentResult per item, in the same order; failures don't raise.
+        start = time.perf_counter()
+        submitted = []
+        for key, amount in payments:
+            try:
+                future, deduplicated = self.cache.get_or_submit(
+                    key, amount, lambda amount = amount: self._pool.submit(self._process, amount))
+            except IdempotencyConflictError as e:
+                future, deduplicated = Future(), False
+                future.set_exception(e)
+            submitted.append((key, amount, future, deduplicated))
+
+        results = []
+        for key, amount, future, deduplicated in submitted:
+            try:
+                response, finished = future.result()
+            except Exception as e:
+                results.append(PaymentResult(key, amount, error = e, deduplicated = deduplicated,
+                                             latency = time.perf_counter() - start))
+            else:
+                latency = max(0.0, finished - start)
+                results.append(PaymentResult(key, amount, response, deduplicated = deduplicated, latency = latency))
+        return results
+
+    def _process(self, amount):
+        response = self.old_gateway.process_payment(amount)
+        return response, time.perf_counter()
+
+    def close(self):
+        self._pool.shutdown()
+
+
+# Client Code
+if __name__ == '__main__':
+    gateway = SlowOldPaymentGateway(latency = 0.05, failure_rate = 0.1, seed = 4)
+    adapter = BatchPaymentAdapter(gateway, max_workers = 8)
+
+    batch = [(f'order-{i}', 100 + i) for i in range(20)]
+    batch.append(('order-3', 103))  # a client retry inside the same batch
+
+    start = time.perf_counter()
+    results = adapter.make_payments(batch)
+    print(f'{len(results)} payments in {time.perf_counter() - start:.2f}s, gateway calls: {gateway.calls}')
+    for result in results[:3] + [r for r in results if r.deduplicated or not r.ok]:
+        print(result)
+
+    # Retrying the whole batch later: successes come from the cache, only declined ones hit the gateway
+    retried = adapter.make_payments(batch)
+    print(f'retry: {sum(r.ok for r in retried)} ok, gateway calls now {gateway.calls}')
+    adapter.close()
@@ -0,0 +1,53 @@
+import random
+import time
+
+from batch_payment_adapter import BatchPaymentAdapter, SlowOldPaymentGateway
+from payment_adapter import PaymentAdapter
+
+
+# Sends batches to a gateway that blocks ~20ms per call: the original
+# one-at-a-time PaymentAdapter against BatchPaymentAdapter with growing
+# pools, then a batch where 20% of the items are client retries.
+
+PAYMENTS = 1000
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+if __name__ == '__main__':
+    batch = [(f'order-{i}', 100 + i % 900) for i in range(PAYMENTS)]
+
+    sequential = batch[:200]  # the full batch would take 20+ seconds
+    adapter = PaymentAdapter(SlowOldPaymentGateway(seed = 1))
+    start = time.perf_counter()
+    for _, amount in sequential:
+        adapter.make_payment(amount)
+    elapsed = time.perf_counter() - start
+    print(f'{"PaymentAdapter, sequential":<30} {len(sequential) / elapsed:>8,.0f} payments/s')
+
+    for workers in (8, 32, 128):
+        gateway = SlowOldPaymentGateway(seed = 1)
+        adapter = BatchPaymentAdapter(gateway, max_workers = workers)
+        start = time.perf_counter()
+        results = adapter.make_payments(batch)
+        elapsed = time.perf_counter() - start
+        adapter.close()
+        latencies = [r.latency for r in results]
+        print(f'{f"BatchPaymentAdapter, {workers} workers":<30} {len(batch) / elapsed:>8,.0f} payments/s, '
+              f'p50 {percentile(latencies, 0.5) * 1e3:,.0f}ms, p99 {percentile(latencies, 0.99) * 1e3:,.0f}ms')
+
+    # 20% of the items repeat an earlier key: they wait on the first attempt
+    rng = random.Random(3)
+    with_retries = batch + [rng.choice(batch) for _ in range(PAYMENTS // 5)]
+    rng.shuffle(with_retries)
+    gateway = SlowOldPaymentGateway(seed = 1)
+    adapter = BatchPaymentAdapter(gateway, max_workers = 32)
+    start = time.perf_counter()
+    results = adapter.make_payments(with_retries)
+    elapsed = time.perf_counter() - start
+    adapter.close()
+    print(f'{len(with_retries):,} items with retries: {gateway.calls:,} gateway calls, '
+          f'{sum(r.deduplicated for r in results):,} deduplicated, {elapsed:.2f}s')
@@ -0,0 +1,133 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy
+except ImportError:  # array('d') buffers still work, just without vectorization
+    numpy = None
+
+
+class UnknownUnitError(ValueError):
+    pass
+
+
+class UnitRegistry:
+    # Known conversions are edges (1 unit = factor * base). The factor for
+    # any pair is found once by walking those edges and multiplying, then
+    # cached, so converting never searches again.
+
+    def __init__(self):
+        self._edges = {}
+        self._factors = {}
+
+    def define(self, unit, factor, base):
+        self._edges.setdefault(unit, {})[base] = factor
+        self._edges.setdefault(base, {})[unit] = 1 / factor
+        self._factors.clear()
+
+    def factor(self, source, target):
+        key = (source, target)
+        factor = self._factors.get(key)
+        if factor is None:
+            factor = self._factors[key] = self._compose(source, target)
+        return factor
+
+    def _compose(self, source, target):
+        for unit in (source, target):
+            if unit not in self._edges:
+                raise UnknownUnitError(f'Unknown unit: {unit}')
+        # Breadth-first, so the chain with the fewest steps (least rounding) wins
+        factors = {source: 1.0}
+        queue = deque([source])
+        while queue:
+            unit = queue.popleft()
+            if unit == target:
+                return factors[unit]
+            for neighbour, factor in self._edges[unit].items():
+                if neighbour not in factors:
+                    factors[neighbour] = factors[unit] * factor
+                    queue.append(neighbour)
+        raise UnknownUnitError(f'No conversion from {source} to {target}')
+
+
+units = UnitRegistry()
+units.define('lb', 0.45359237, 'kg')
+units.define('oz', 1 / 16, 'lb')
+units.define('st', 14, 'lb')
+units.define('kg', 1000, 'g')
+units.define('g', 1000, 'mg')
+units.define('t', 1000, 'kg')
+
+
+class BatchWeightAdapter:
+    # Converts whole batches of readings instead of one get_weight_in_kg()
+    # call per reading. Works in place on numpy float64 arrays (strided views
+    # included) and on any other contiguous buffer of doubles: array('d'),
+    # or a bytearray holding them.
+
+    def __init__(self, source_unit = 'lb', target_unit = 'kg', registry = units):
+        self.source_unit = source_unit
+        self.target_unit = target_unit
+        self.factor = registry.factor(source_unit, target_unit)
+
+    def convert(self, readings):
+        if numpy is not None and isinstance(readings, numpy.ndarray):
+            # numpy handles strided views such as a[::2] itself
+            if readings.dtype != numpy.float64 or not readings.flags.writeable:
+                raise TypeError('readings must be a writable float64 array')
+            readings *= self.factor
+            return readings
+        view = memoryview(readings)
+        if view.format != 'd' or view.readonly:
+            raise TypeError('readings must be a writable buffer of float64 values')
+        if not view.c_contiguous:
+            raise TypeError('readings must be a contiguous buffer, copy strided views first')
+        if numpy is not None:
+            values = numpy.frombuffer(view, dtype = numpy.float64)  # a view, no copy
+            values *= self.factor
+        else:
+            view = view.cast('B').cast('d')
+            view[:] = array('d', map(self.factor.__mul__, view))
+        return readings
+
+    def stream(self, path, chunk_readings = 1 << 20):
+        # Yields converted chunks of a file of native float64 readings. Every
+        # chunk reuses one buffer, so copy it if you keep it past the next
+        # iteration.
+        buffer = bytearray(chunk_readings * 8)
+        view = memoryview(buffer)
+        with open(path, 'rb', buffering = 0) as f:
+            while True:
+                filled = f.readinto(view)
+                if not filled:
+                    return
+                while filled % 8:
+                    more = f.readinto(view[filled:])  # short read mid-value
+                    if not more:
+                        raise ValueError(f'{path} ends in a partial reading')
+                    filled += more
+                chunk = view[:filled].cast('d')
+                self.convert(chunk)
+                yield chunk
+
+    def convert_file(self, source_path, target_path, chunk_readings = 1 << 20):
+        count = 0
+        with open(target_path, 'wb') as out:
+            for chunk in self.stream(source_path, chunk_readings):
+                out.write(chunk)
+                count += len(chunk)
+        return count
+
+
+# Client Code
+if __name__ == '__main__':
+    readings = array('d', [28.0, 30.5, 12.25])
+    BatchWeightAdapter('lb', 'kg').convert(readings)
+    print(readings)
+
+    print(f'oz -> mg factor: {units.factor("oz", "mg"):.4f}')
+
+    if numpy is not None:
+        stones = numpy.array([1.5, 2.0, 80.0])
+        BatchWeightAdapter('st', 'g').convert(stones)
+        print(stones)
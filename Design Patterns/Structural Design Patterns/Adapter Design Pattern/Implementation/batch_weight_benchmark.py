@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+from array import array
+
+from batch_weight_adapter import BatchWeightAdapter, numpy
+import batch_weight_adapter
+
+
+# Converts millions of pound readings to kilograms: one adapter call per
+# reading (the WeightMachineAdapterImpl shape), BatchWeightAdapter on an
+# array('d') with and without numpy, and streaming a binary file of
+# readings in chunks.
+
+READINGS = 5_000_000
+
+
+class Reading:
+    def __init__(self, pounds):
+        self.pounds = pounds
+
+    def get_weight_in_pound(self):
+        return self.pounds
+
+
+class PerReadingAdapter:
+    def __init__(self, weight_machine):
+        self.__weight_machine = weight_machine
+
+    def get_weight_in_kg(self):
+        return self.__weight_machine.get_weight_in_pound() * 0.45359237
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def rate(elapsed, count = READINGS):
+    return f'{elapsed:.3f}s ({count / elapsed / 1e6:,.1f}M readings/s)'
+
+
+if __name__ == '__main__':
+    values = array('d', (i % 400 / 4 for i in range(READINGS)))
+
+    _, elapsed = timed(lambda: [PerReadingAdapter(Reading(v)).get_weight_in_kg() for v in values])
+    print(f'one adapter call per reading: {rate(elapsed)}')
+
+    adapter = BatchWeightAdapter('lb', 'kg')
+    if numpy is not None:
+        readings = array('d', values)
+        _, elapsed = timed(adapter.convert, readings)
+        print(f'batch, array(\'d\') via numpy:  {rate(elapsed)}')
+        expected = readings
+
+    saved, batch_weight_adapter.numpy = batch_weight_adapter.numpy, None
+    try:
+        readings = array('d', values)
+        _, elapsed = timed(adapter.convert, readings)
+        print(f'batch, array(\'d\') pure Python: {rate(elapsed)}')
+    finally:
+        batch_weight_adapter.numpy = saved
+    if numpy is not None:
+        assert readings == expected
+
+    with tempfile.TemporaryDirectory() as directory:
+        source, target = os.path.join(directory, 'pounds.bin'), os.path.join(directory, 'kg.bin')
+        with open(source, 'wb') as f:
+            for _ in range(8):
+                values.tofile(f)
+        size = os.path.getsize(source)
+        for chunk_readings in (1 << 14, 1 << 20):
+            count, elapsed = timed(adapter.convert_file, source, target, chunk_readings)
+            print(f'stream {size / 2**20:,.0f}MB file, {chunk_readings * 8 // 1024:,}KB chunks: {rate(elapsed, count)}')
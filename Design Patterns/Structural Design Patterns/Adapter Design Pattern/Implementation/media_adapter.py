@@ -36,34 +36,47 @@ class Mp4Player(AdvancedMediaPlayer):
 
 # Media Adapter takes old media player and adds vlc, mp4 functionality to it.
 class MediaAdapter(MediaPlayer):
+    # format -> (player class, method); the method is looked up once per adapter
+    PLAYERS = {
+        'vlc': (VLCPlayer, 'play_vlc'),
+        'mp4': (Mp4Player, 'play_mp4'),
+    }
+
     def __init__(self, audio_type):
-       if audio_type == 'vlc':
-           self.__advanced_media_player = VLCPlayer()
-       else:
-           self.__advanced_media_player = Mp4Player()
-    
+        player_class, method = self.PLAYERS[audio_type]
+        self.__advanced_media_player = player_class()
+        self.__play = getattr(self.__advanced_media_player, method)
+
     def play(self, audio_type, file_name):
-        if audio_type == 'vlc':
-            self.__advanced_media_player.play_vlc(file_name)
-        else:
-            self.__advanced_media_player.play_mp4(file_name)
+        self.__play(file_name)
 
 
 class AudioPlayer(MediaPlayer):
+    # Adapters are created on first use of a format and then reused, so a
+    # playlist doesn't build a new adapter and player per file
     def __init__(self):
-        self.__mediaAdapter = None 
-    
+        self.__adapters = {}
+
     def play(self, audio_type, file_name):
         if audio_type == 'mp3':
             print(f'Playing mp3 file: {file_name}')
-        elif audio_type in ['mp4', 'vlc']:
-            self.__mediaAdapter = MediaAdapter(audio_type)
-            self.__mediaAdapter.play(audio_type, file_name)
-        else:
-            print('Invalid media format')
+            return
+        adapter = self.__adapters.get(audio_type)
+        if adapter is None:
+            if audio_type not in MediaAdapter.PLAYERS:
+                print('Invalid media format')
+                return
+            adapter = self.__adapters[audio_type] = MediaAdapter(audio_type)
+        adapter.play(audio_type, file_name)
+
+    def supports(self, audio_type):
+        return audio_type == 'mp3' or audio_type in MediaAdapter.PLAYERS
+
 
-audio_player = AudioPlayer()
-audio_player.play('mp3', 'beyond.mp3')
-audio_player.play('vlc', 'dookudu.vlc')
-audio_player.play('mp4', 'bluebird.mp4')
-audio_player.play('avi', 'cinema.avi')
\ No newline at end of file
+# Client Code
+if __name__ == '__main__':
+    audio_player = AudioPlayer()
+    audio_player.play('mp3', 'beyond.mp3')
+    audio_player.play('vlc', 'dookudu.vlc')
+    audio_player.play('mp4', 'bluebird.mp4')
+    audio_player.play('avi', 'cinema.avi')
@@ -16,8 +16,10 @@ class PaymentAdapter(NewPaymentGateway):
     def make_payment(self, amount):
         return self.old_gateway.process_payment(amount)
 
-old_gateway = OldPaymentGateway()
-adapter = PaymentAdapter(old_gateway)
+# Client Code
+if __name__ == '__main__':
+    old_gateway = OldPaymentGateway()
+    adapter = PaymentAdapter(old_gateway)
+
+    print(adapter.make_payment(1000))
 
-print(adapter.make_payment(1000))
-        
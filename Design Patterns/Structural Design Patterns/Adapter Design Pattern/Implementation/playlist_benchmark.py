@@ -0,0 +1,107 @@
+import contextlib
+import os
+import tempfile
+import time
+import zlib
+
+from media_adapter import AudioPlayer, Mp4Player, VLCPlayer
+from playlist_engine import PlaylistEngine, detect_format
+
+
+# 1. Dispatch: the old AudioPlayer (new adapter and player per call, string
+#    comparisons on both sides) against the cached dispatch table.
+# 2. Streaming: PlaylistEngine (readinto one reusable buffer, memoryview
+#    chunks) against reading each chunk into a new bytes object.
+# Players print, so stdout goes to a writer that discards everything.
+
+class LegacyMediaAdapter:
+    def __init__(self, audio_type):
+        if audio_type == 'vlc':
+            self.__advanced_media_player = VLCPlayer()
+        else:
+            self.__advanced_media_player = Mp4Player()
+
+    def play(self, audio_type, file_name):
+        if audio_type == 'vlc':
+            self.__advanced_media_player.play_vlc(file_name)
+        else:
+            self.__advanced_media_player.play_mp4(file_name)
+
+
+class LegacyAudioPlayer:
+    def play(self, audio_type, file_name):
+        if audio_type == 'mp3':
+            print(f'Playing mp3 file: {file_name}')
+        elif audio_type in ['mp4', 'vlc']:
+            LegacyMediaAdapter(audio_type).play(audio_type, file_name)
+        else:
+            print('Invalid media format')
+
+
+class NullWriter:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class Crc32Device:
+    # Stands in for an audio device: consumes every byte without keeping it
+    def __init__(self):
+        self.crc = 0
+
+    def write(self, chunk):
+        self.crc = zlib.crc32(chunk, self.crc)
+
+
+def naive_stream(paths, chunk_size, sink):
+    player = AudioPlayer()
+    total = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            chunk = f.read(chunk_size)
+            audio_type = detect_format(chunk[:12])
+            player.play(audio_type, os.path.basename(path))
+            while chunk:
+                sink(chunk)
+                total += len(chunk)
+                chunk = f.read(chunk_size)
+    return total
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    plays = [('vlc', 'dookudu.vlc'), ('mp4', 'bluebird.mp4')] * 100_000
+    with contextlib.redirect_stdout(NullWriter()):
+        legacy = LegacyAudioPlayer()
+        _, old = timed(lambda: [legacy.play(*play) for play in plays])
+        player = AudioPlayer()
+        _, new = timed(lambda: [player.play(*play) for play in plays])
+    print(f'dispatch: {len(plays):,} plays, new adapter per call {old / len(plays) * 1e9:.0f}ns, '
+          f'cached adapter {new / len(plays) * 1e9:.0f}ns')
+
+    headers = (b'ID3\x04\x00', b'\x00\x00\x00\x18ftypmp42', b'\x1a\x45\xdf\xa3')
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(10_000):
+            paths.append(os.path.join(directory, f'track{i}'))
+            with open(paths[-1], 'wb') as f:
+                f.write(headers[i % 3] + os.urandom(256 * 1024 - 16))
+        total = len(paths) * 256 * 1024
+
+        for chunk_size in (16 * 1024, 64 * 1024):
+            checksums = []
+            for label, run in (('bytes per chunk', lambda sink: naive_stream(paths, chunk_size, sink)),
+                               ('memoryview     ', lambda sink: PlaylistEngine(chunk_size = chunk_size, sink = sink).play(paths))):
+                device = Crc32Device()
+                with contextlib.redirect_stdout(NullWriter()):
+                    _, elapsed = timed(run, device.write)
+                checksums.append(device.crc)
+                print(f'{chunk_size // 1024:>3}KB chunks, {label}: {elapsed:.2f}s ({total / 2**20 / elapsed:,.0f}MB/s)')
+            assert checksums[0] == checksums[1]
@@ -0,0 +1,101 @@
+import os
+from collections import Counter
+
+from media_adapter import AudioPlayer
+
+# (offset, signature, format). 'vlc' stands for the containers VLC is used
+# for here: Matroska/WebM and Ogg.
+MAGIC_SIGNATURES = (
+    (0, b'ID3', 'mp3'),  # MP3 with an ID3v2 tag
+    (4, b'ftyp', 'mp4'),  # ISO base media: mp4, m4a, mov
+    (0, b'\x1a\x45\xdf\xa3', 'vlc'),  # EBML: mkv, webm
+    (0, b'OggS', 'vlc'),
+)
+HEADER_SIZE = 12
+
+
+def detect_format(header):
+    # header: the first bytes of the file (bytes or memoryview)
+    for offset, signature, audio_type in MAGIC_SIGNATURES:
+        if header[offset:offset + len(signature)] == signature:
+            return audio_type
+    # Bare MPEG audio frame: 11 sync bits set
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return 'mp3'
+    return None
+
+
+class PlaylistReport:
+    def __init__(self):
+        self.played = Counter()  # format -> files
+        self.bytes = 0
+        self.skipped = []  # (path, reason)
+
+
+class PlaylistEngine:
+    # Plays a list of files through AudioPlayer, picking the format from the
+    # file's magic bytes rather than its name. Content is streamed with
+    # readinto() into one reusable buffer and handed to `sink` as memoryview
+    # slices, so no per-chunk bytes objects are created. The sink must not
+    # keep a view after it returns; the buffer is overwritten by the next read.
+
+    def __init__(self, player = None, chunk_size = 64 * 1024, sink = None):
+        self.player = player or AudioPlayer()
+        self.chunk_size = chunk_size
+        self.sink = sink  # callable(memoryview), e.g. an audio device's write
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+
+    def play(self, paths):
+        report = PlaylistReport()
+        view, sink = self._view, self.sink
+        for path in paths:
+            try:
+                with open(path, 'rb', buffering = 0) as f:
+                    filled = f.readinto(view)
+                    audio_type = detect_format(view[:min(filled, HEADER_SIZE)])
+                    if audio_type is None or not self.player.supports(audio_type):
+                        report.skipped.append((path, 'unknown format'))
+                        continue
+
+                    self.player.play(audio_type, os.path.basename(path))
+                    while filled:
+                        if sink is not None:
+                            sink(view[:filled])
+                        report.bytes += filled
+                        filled = f.readinto(view)
+            except OSError as e:
+                report.skipped.append((path, str(e)))
+                continue
+            report.played[audio_type] += 1
+        return report
+
+
+# Client Code
+if __name__ == '__main__':
+    import tempfile
+    import zlib
+
+    samples = {
+        'beyond.audio': b'ID3\x04\x00' + bytes(200_000),
+        'dookudu.audio': b'\x1a\x45\xdf\xa3' + bytes(150_000),
+        'bluebird.audio': b'\x00\x00\x00\x18ftypmp42' + bytes(300_000),
+        'cinema.audio': b'RIFF\x00\x00\x00\x00AVI ' + bytes(1000),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for name, data in samples.items():
+            paths.append(os.path.join(directory, name))
+            with open(paths[-1], 'wb') as f:
+                f.write(data)
+
+        checksum = 0
+
+        def device(chunk):
+            global checksum
+            checksum = zlib.crc32(chunk, checksum)  # reads the view in place
+
+        report = PlaylistEngine(sink = device).play(paths)
+        print(f'played {dict(report.played)}, {report.bytes:,} bytes streamed, crc32 {checksum:08x}')
+        for path, reason in report.skipped:
+            print(f'skipped {os.path.basename(path)}: {reason}')
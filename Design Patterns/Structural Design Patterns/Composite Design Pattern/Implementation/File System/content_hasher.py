@@ -0,0 +1,130 @@
+import hashlib
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from file_system_composite_pattern import File
+
+CHUNK_SIZE = 1 << 20
+MMAP_THRESHOLD = 4 << 20  # smaller files are read in one call
+BATCH_BYTES = 64 << 20  # work handed to a process at once, so small files share one round trip
+BATCH_FILES = 512
+
+
+def hash_file(path, algorithm = 'blake2b'):
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            digest.update(f.read())
+        else:
+            # Pages come straight from the page cache, no read() copies
+            with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data, memoryview(data) as view:
+                for offset in range(0, size, CHUNK_SIZE):
+                    digest.update(view[offset:offset + CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+def _hash_batch(paths, algorithm):
+    # Runs in a worker process
+    results = []
+    for path in paths:
+        try:
+            results.append((path, hash_file(path, algorithm), None))
+        except OSError as e:
+            results.append((path, None, e))
+    return results
+
+
+class HashReport:
+    def __init__(self):
+        self.files = 0  # File nodes in the tree
+        self.hashed = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+        self.errors = []  # (path, OSError)
+
+    @property
+    def mb_per_second(self):
+        return self.bytes / 2**20 / self.elapsed if self.elapsed else 0.0
+
+
+class ContentHasher:
+    # Hashes the files of a Directory composite and stores the digest on
+    # each File. With candidates_only (the default), files whose size no
+    # other file shares are skipped, since they can't have a duplicate.
+    # Hashing runs in a process pool, in batches of roughly BATCH_BYTES.
+
+    def __init__(self, max_workers = None, algorithm = 'blake2b'):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.algorithm = algorithm
+
+    def hash_tree(self, root, base_path, candidates_only = True):
+        # base_path is where root lives on disk (what was passed to DiskScanner.scan)
+        report = HashReport()
+        start = time.perf_counter()
+
+        by_size = {}
+        for path, node in root.walk():
+            if isinstance(node, File):
+                by_size.setdefault(node.get_size(), []).append((os.path.join(base_path, path), node))
+                report.files += 1
+
+        empty = hashlib.new(self.algorithm).hexdigest()
+        pending = []
+        for size, group in by_size.items():
+            if candidates_only and len(group) < 2:
+                continue
+            if size == 0:
+                for _, node in group:
+                    node.digest = empty
+                report.hashed += len(group)
+                continue
+            pending.extend(group)
+
+        nodes = dict(pending)
+        with ProcessPoolExecutor(self.max_workers) as pool:
+            futures = [pool.submit(_hash_batch, batch, self.algorithm) for batch in self._batches(pending)]
+            for future in as_completed(futures):
+                for path, digest, error in future.result():
+                    if error is not None:
+                        report.errors.append((path, error))
+                        continue
+                    node = nodes[path]
+                    node.digest = digest
+                    report.hashed += 1
+                    report.bytes += node.get_size()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def _batches(files):
+        batch, batch_bytes = [], 0
+        for path, node in files:
+            batch.append(path)
+            batch_bytes += node.get_size()
+            if batch_bytes >= BATCH_BYTES or len(batch) >= BATCH_FILES:
+                yield batch
+                batch, batch_bytes = [], 0
+        if batch:
+            yield batch
+
+
+# Client Code
+if __name__ == '__main__':
+    from disk_scanner import DiskScanner, format_size
+
+    target = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else sys.prefix)
+    root = DiskScanner().scan(target)
+    report = ContentHasher().hash_tree(root, target)
+    print(f'{report.files:,} files, hashed {report.hashed:,} same-size candidates '
+          f'({format_size(report.bytes)}) in {report.elapsed:.2f}s, {report.mb_per_second:,.0f}MB/s')
+
+    duplicates = root.find_duplicates()
+    wasted = sum(size * (len(paths) - 1) for size, paths in duplicates)
+    print(f'{len(duplicates):,} groups of duplicates, {format_size(wasted)} reclaimable')
+    for size, paths in duplicates[:5]:
+        print(f'  {format_size(size)}: ' + ' == '.join(paths[:3]) + (' ...' if len(paths) > 3 else ''))
@@ -0,0 +1,62 @@
+import os
+import random
+import tempfile
+import time
+
+from content_hasher import ContentHasher, hash_file
+from disk_scanner import DiskScanner
+from file_system_composite_pattern import File
+
+
+# Writes a synthetic tree of mixed-size files, a fraction of them copies,
+# and compares hashing every file serially with ContentHasher (size grouping
+# plus a process pool).
+
+def make_files(root, directories = 20, files_per_directory = 50, duplicate_rate = 0.2, seed = 2):
+    rng = random.Random(seed)
+    written = []
+    total = 0
+    for d in range(directories):
+        directory = os.path.join(root, f'dir{d}')
+        os.mkdir(directory)
+        for i in range(files_per_directory):
+            path = os.path.join(directory, f'file{i}.bin')
+            if written and rng.random() < duplicate_rate:
+                data = open(rng.choice(written), 'rb').read()
+            else:
+                # Mostly small files, some large enough to go through mmap
+                size = rng.choice((rng.randrange(1, 64 << 10), rng.randrange(1, 64 << 10), rng.randrange(1 << 20, 6 << 20)))
+                data = rng.randbytes(size)
+            with open(path, 'wb') as f:
+                f.write(data)
+            written.append(path)
+            total += len(data)
+    return len(written), total
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        count, total = make_files(directory)
+        print(f'{count:,} files, {total / 2**20:,.0f}MB, {os.cpu_count()} CPUs')
+
+        root = DiskScanner().scan(directory)
+        start = time.perf_counter()
+        for path, node in root.walk():
+            if isinstance(node, File):
+                hash_file(os.path.join(directory, path))
+        serial = time.perf_counter() - start
+        print(f'serial, every file:        {serial:.2f}s ({total / 2**20 / serial:,.0f}MB/s)')
+
+        for workers in sorted({1, os.cpu_count() or 1, 4}):
+            root = DiskScanner().scan(directory)
+            report = ContentHasher(workers).hash_tree(root, directory, candidates_only = False)
+            print(f'pool of {workers}, every file:     {report.elapsed:.2f}s ({report.mb_per_second:,.0f}MB/s)')
+
+            root = DiskScanner().scan(directory)
+            report = ContentHasher(workers).hash_tree(root, directory)
+            print(f'pool of {workers}, size groups:    {report.elapsed:.2f}s, hashed {report.hashed:,} of '
+                  f'{report.files:,} files, {report.bytes / 2**20:,.0f}MB')
+
+        duplicates = root.find_duplicates()
+        print(f'{len(duplicates):,} duplicate groups, '
+              f'{sum(size * (len(paths) - 1) for size, paths in duplicates) / 2**20:,.0f}MB reclaimable')
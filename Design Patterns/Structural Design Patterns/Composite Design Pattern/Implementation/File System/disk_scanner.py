@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+
+from file_system_composite_pattern import Directory, File
+
+
+class DiskScanner:
+    # Builds a Directory/File composite from a real path. Every directory is
+    # one pool task that only does I/O (os.scandir plus lstat, which release
+    # the GIL); the calling thread turns finished listings into nodes.
+    #
+    # A directory is attached to its parent once its own files are in, so its
+    # size travels up the tree once instead of once per file. Children end up
+    # in the order their listings finished, not in name order.
+
+    def __init__(self, max_workers = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.errors = []  # (path, OSError) for directories that could not be listed
+
+    def scan(self, path):
+        path = os.path.abspath(path)
+        root = Directory(os.path.basename(path) or path)
+        self.errors = []
+
+        finished = SimpleQueue()
+
+        def list_directory(directory, parent, directory_path):
+            try:
+                listing = self._list(directory_path)
+            except Exception as e:  # always report back, or scan() would wait forever
+                listing = ([], [], e)
+            finished.put((directory, parent, directory_path, listing))
+
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            pool.submit(list_directory, root, None, path)
+            outstanding = 1
+            while outstanding:
+                directory, parent, directory_path, (subdirectories, files, error) = finished.get()
+                outstanding -= 1
+                if error is not None:
+                    self.errors.append((directory_path, error))
+
+                for name, size, mtime in files:
+                    directory.add(File(name, size, mtime))
+                if parent is not None:
+                    parent.add(directory)
+                for name, subdirectory_path in subdirectories:
+                    pool.submit(list_directory, Directory(name), directory, subdirectory_path)
+                outstanding += len(subdirectories)
+        return root
+
+    @staticmethod
+    def _list(path):
+        # Runs in a pool thread: returns plain tuples, builds no nodes
+        subdirectories = []
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks = False):
+                            subdirectories.append((entry.name, entry.path))
+                        else:
+                            stat = entry.stat(follow_symlinks = False)
+                            files.append((entry.name, stat.st_size, stat.st_mtime))
+                    except OSError:
+                        continue  # vanished while we were listing
+        except OSError as e:
+            return subdirectories, files, e
+        return subdirectories, files, None
+
+
+def format_size(size):
+    for unit in ('B', 'K', 'M', 'G', 'T'):
+        if size < 1024 or unit == 'T':
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+
+
+# Client Code
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else sys.prefix
+
+    scanner = DiskScanner()
+    start = time.perf_counter()
+    root = scanner.scan(target)
+    elapsed = time.perf_counter() - start
+
+    entries = sum(1 for _ in root.walk())
+    print(f'scanned {entries:,} entries under {target} in {elapsed:.2f}s '
+          f'({len(scanner.errors)} unreadable directories)')
+
+    # du -d 1, largest first
+    children = sorted(root.get_children(), key = lambda node: node.du(), reverse = True)
+    print(f'{format_size(root.du()):>8}  {root.get_name()}')
+    for node in children[:10]:
+        print(f'{format_size(node.du()):>8}  {root.get_name()}/{node.get_name()}')
+
+    # Streaming walk: nothing is collected, deep trees are fine
+    newest = max((node for _, node in root.walk() if isinstance(node, File)),
+                 key = lambda node: node.get_mtime(), default = None)
+    if newest is not None:
+        print(f'most recently modified: {newest.get_name()} '
+              f'({time.strftime("%Y-%m-%d %H:%M", time.localtime(newest.get_mtime()))})')
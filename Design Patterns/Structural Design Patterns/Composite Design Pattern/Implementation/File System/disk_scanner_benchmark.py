@@ -0,0 +1,60 @@
+import os
+import tempfile
+import time
+
+from disk_scanner import DiskScanner
+from file_system_composite_pattern import Directory, File
+
+
+# Scans a synthetic tree with different pool sizes and compares it with a
+# single-threaded os.walk that builds the same composite.
+
+def make_tree(root, directories = 2000, files_per_directory = 50, fanout = 10):
+    paths = [root]
+    for i in range(1, directories):
+        path = os.path.join(paths[(i - 1) // fanout], f'dir{i}')
+        os.mkdir(path)
+        paths.append(path)
+    for path in paths:
+        for j in range(files_per_directory):
+            with open(os.path.join(path, f'file{j}.dat'), 'wb') as f:
+                f.write(b'x' * j)
+    return directories * (files_per_directory + 1) - 1
+
+
+def walk_scan(path):
+    nodes = {}
+    root = None
+    for directory_path, subdirectories, files in os.walk(path):
+        directory = Directory(os.path.basename(directory_path))
+        for name in files:
+            stat = os.lstat(os.path.join(directory_path, name))
+            directory.add(File(name, stat.st_size, stat.st_mtime))
+        parent = nodes.get(os.path.dirname(directory_path))
+        if parent is None:
+            root = directory
+        else:
+            parent.add(directory)
+        nodes[directory_path] = directory
+    return root
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        entries = make_tree(directory)
+        print(f'{entries:,} entries')
+
+        root, elapsed = timed(walk_scan, directory)
+        expected = root.du()
+        print(f'os.walk, 1 thread: {elapsed:.2f}s')
+
+        for workers in (1, 4, 16, 32):
+            root, elapsed = timed(DiskScanner(workers).scan, directory)
+            assert root.du() == expected
+            print(f'DiskScanner, {workers:>2} threads: {elapsed:.2f}s ({entries / elapsed:,.0f} entries/s)')
@@ -1,34 +1,229 @@
+import math
+import mmap
+import struct
 from abc import ABC, abstractmethod
+from array import array
+
+from path_index import PathIndex
 
 class FileSystem(ABC):
+    __slots__ = ('parent',)  # parent is set by Directory.add
+
     @abstractmethod
     def ls(self):
         pass
 
+    @abstractmethod
+    def get_name(self):
+        pass
+
+    # Total bytes, like `du`
+    @abstractmethod
+    def du(self):
+        pass
+
 class File(FileSystem):
-    def __init__(self, name):
-        self.__file_name = name 
-    
+    __slots__ = ('__file_name', '__size', '__mtime', 'digest')
+
+    def __init__(self, name, size = 0, mtime = None):
+        self.parent = None
+        self.__file_name = name
+        self.__size = size
+        self.__mtime = mtime
+        self.digest = None  # content hash, filled in by ContentHasher
+
+    def get_name(self):
+        return self.__file_name
+
+    def get_size(self):
+        return self.__size
+
+    def get_mtime(self):
+        return self.__mtime
+
+    def du(self):
+        return self.__size
+
     def ls(self):
         print(f'file name: {self.__file_name}')
 
 
 class Directory(FileSystem):
+    # Keeps the total size of its subtree; add() pushes the new child's size
+    # up the parent chain, so du() is O(1). A PathIndex built by index() is
+    # updated by the same walk whenever something is added below.
+    # Directories loaded from a snapshot read their children on first access.
+    __slots__ = ('__directory_name', '__file_system_list', '__size', '__index', '__load_children')
+
     def __init__(self, name):
+        self.parent = None
         self.__directory_name = name
         self.__file_system_list = []
+        self.__size = 0
+        self.__index = None
+        self.__load_children = None
+
+    @classmethod
+    def _lazy(cls, name, size, load_children):
+        directory = cls(name)
+        directory.__size = size
+        directory.__load_children = load_children
+        return directory
+
+    def __children(self):
+        if self.__load_children is not None:
+            load_children, self.__load_children = self.__load_children, None
+            self.__file_system_list = load_children(self)
+        return self.__file_system_list
+
+    def get_name(self):
+        return self.__directory_name
+
+    def get_children(self):
+        return iter(self.__children())
+
+    def du(self):
+        return self.__size
 
     def add(self, file_system_obj):
-        self.__file_system_list.append(file_system_obj)
-    
+        if file_system_obj.parent is not None:
+            raise ValueError(f'{file_system_obj.get_name()} is already in {file_system_obj.parent.get_name()}')
+        node = self
+        while node is not None:  # adding an ancestor would make a cycle
+            if node is file_system_obj:
+                raise ValueError(f'{file_system_obj.get_name()} cannot be added inside itself')
+            node = node.parent
+        self.__children().append(file_system_obj)
+        file_system_obj.parent = self
+
+        size = file_system_obj.du()
+        components = []  # names from the indexed directory down to self
+        node = self
+        while node is not None:
+            node.__size += size
+            components.append(node.get_name())
+            if node.__index is not None:
+                node.__index.insert_under(components[::-1], file_system_obj)
+            node = node.parent
+
+    def index(self):
+        if self.__index is None:
+            self.__index = PathIndex(self)
+        return self.__index
+
+    def walk(self):
+        # Yields (path, node) in depth-first order with an explicit stack, so
+        # arbitrarily deep trees are fine. Paths are relative to this directory.
+        stack = [('', self)]
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+            if isinstance(node, Directory):
+                prefix = f'{path}/' if path else ''
+                stack.extend((prefix + child.get_name(), child) for child in reversed(node.__children()))
+
     def ls(self):
-        print(f'Directory Name: {self.__directory_name}')
+        for _, node in self.walk():
+            if isinstance(node, Directory):
+                print(f'Directory Name: {node.get_name()}')
+            else:
+                print(f'file name: {node.get_name()}')
+
+    def find_duplicates(self):
+        # [(size, [path, ...]), ...] for files with the same content digest,
+        # most wasted bytes first. Only files that were hashed take part.
+        by_digest = {}
+        for path, node in self.walk():
+            if isinstance(node, File) and node.digest is not None:
+                by_digest.setdefault((node.get_size(), node.digest), []).append(path)
+        groups = [(size, paths) for (size, _), paths in by_digest.items() if len(paths) > 1]
+        groups.sort(key = lambda group: group[0] * (len(group[1]) - 1), reverse = True)
+        return groups
+
+    def save_snapshot(self, path):
+        # Layout (little endian):
+        #   header        magic, node count, string table size
+        #   node table    one _NODE record per node, breadth-first, so each
+        #                 directory's children are one contiguous run
+        #   parent index  uint32 per node (root: _NO_PARENT), lets a reader
+        #                 go from any record up to the root
+        #   string table  utf-8 names, each distinct name stored once
+        order = [self]
+        parents = array('I', [_NO_PARENT])
+        for position, node in enumerate(order):
+            if isinstance(node, Directory):
+                children = node.__children()
+                order.extend(children)
+                parents.extend([position] * len(children))
+
+        strings = {}
+        string_table = bytearray()
+        nodes = bytearray(_NODE.size * len(order))
+        next_child = 1
+        for position, node in enumerate(order):
+            name = node.get_name()
+            location = strings.get(name)
+            if location is None:
+                encoded = name.encode()
+                location = strings[name] = (len(string_table), len(encoded))
+                string_table += encoded
+
+            if isinstance(node, Directory):
+                kind, child_count, mtime = _DIRECTORY, len(node.__file_system_list), math.nan
+            else:
+                kind, child_count, mtime = _FILE, 0, node.get_mtime()
+                if mtime is None:
+                    mtime = math.nan
+            _NODE.pack_into(nodes, position * _NODE.size, *location, kind, next_child, child_count, node.du(), mtime)
+            next_child += child_count
+
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, len(order), len(string_table)))
+            f.write(nodes)
+            f.write(parents.tobytes())
+            f.write(string_table)
 
-        for file_system_obj in self.__file_system_list:
-            file_system_obj.ls()
 
+_MAGIC = b'FSSNAP01'
+_HEADER = struct.Struct('<8sQQ')
+# name offset, name length, kind, first child, child count, size (subtree total for directories), mtime
+_NODE = struct.Struct('<IHBxIIqd')
+_FILE, _DIRECTORY = 0, 1
+_NO_PARENT = 0xFFFFFFFF
 
-# Client Code 
+
+def load_snapshot(path):
+    # Maps the file and returns the root Directory straight away. A
+    # directory's children are decoded from the mapping the first time they
+    # are asked for, so memory grows with the part of the tree actually used.
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+    magic, node_count, string_size = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC:
+        raise ValueError(f'{path} is not a file system snapshot')
+    nodes_at = _HEADER.size
+    strings_at = nodes_at + node_count * (_NODE.size + 4)
+    if len(data) != strings_at + string_size:
+        raise ValueError(f'{path} is truncated or corrupt')
+
+    def materialize(offset, length, kind, first_child, child_count, size, mtime):
+        name = data[strings_at + offset:strings_at + offset + length].decode()
+        if kind == _DIRECTORY:
+            return Directory._lazy(name, size, lambda directory: load_children(directory, first_child, child_count))
+        return File(name, size, None if math.isnan(mtime) else mtime)
+
+    def load_children(directory, first_child, child_count):
+        # Siblings are adjacent records, decoded in one pass
+        start = nodes_at + first_child * _NODE.size
+        children = [materialize(*fields) for fields in _NODE.iter_unpack(data[start:start + child_count * _NODE.size])]
+        for child in children:
+            child.parent = directory
+        return children
+
+    return materialize(*_NODE.unpack_from(data, nodes_at))
+
+
+# Client Code
 
 if __name__ == '__main__':
     movie_directory = Directory('movies')
@@ -50,3 +245,19 @@ if __name__ == '__main__':
     movie_directory.add(comedy_movie_directory)
 
     movie_directory.ls()
+
+    index = movie_directory.index()
+    print(index.resolve('movies/comedy/hulchul').get_name())
+
+    # Added after indexing: the index picks it up
+    comedy_movie_directory.add(File('Golmaal.mp4'))
+    print(index.glob('**/*.mp4'))
+    print(list(index.iter_prefix('movies/comedy/')))
+
+    import os, tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, 'movies.snapshot')
+        movie_directory.save_snapshot(snapshot)
+        restored = load_snapshot(snapshot)
+        print(f'snapshot: {os.path.getsize(snapshot)} bytes, restored du = {restored.du()}')
+        restored.ls()
@@ -0,0 +1,123 @@
+import re
+from fnmatch import translate
+
+
+class _TrieNode:
+    __slots__ = ('node', 'children')
+
+    def __init__(self, node):
+        self.node = node
+        self.children = {}  # path component -> _TrieNode
+
+
+def _has_magic(part):
+    return any(c in part for c in '*?[')
+
+
+class PathIndex:
+    # Path lookups over a Directory tree. Paths start with the indexed
+    # directory's own name ('movies/comedy/hulchul'). A dict maps every full
+    # path to its node, and a trie keyed by path component drives prefix
+    # listing and glob, which only descend into children that can still
+    # match. Directory.add keeps an attached index up to date.
+
+    def __init__(self, root):
+        self._trie = _TrieNode(None)
+        self._paths = {}
+        self.insert(self._trie, '', root)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __contains__(self, path):
+        return path.strip('/') in self._paths
+
+    def insert(self, parent_trie, parent_path, file_system_obj):
+        # Adds file_system_obj and everything below it under parent_path
+        stack = [(parent_trie, parent_path, file_system_obj)]
+        while stack:
+            trie, path, node = stack.pop()
+            name = node.get_name()
+            path = f'{path}/{name}' if path else name
+            child_trie = trie.children[name] = _TrieNode(node)
+            self._paths[path] = node
+            if hasattr(node, 'get_children'):
+                stack.extend((child_trie, path, child) for child in reversed(list(node.get_children())))
+
+    def insert_under(self, components, file_system_obj):
+        # Called by Directory.add: components is the path of the new child's
+        # parent, which is already indexed
+        trie = self._trie
+        for component in components:
+            trie = trie.children[component]
+        self.insert(trie, '/'.join(components), file_system_obj)
+
+    def resolve(self, path):
+        node = self._paths.get(path.strip('/'))
+        if node is None:
+            raise FileNotFoundError(path)
+        return node
+
+    def iter_prefix(self, prefix):
+        # Paths that start with prefix. 'movies/comedy/' lists everything
+        # below comedy; 'movies/co' also matches partial names like 'comedy'.
+        components = prefix.lstrip('/').split('/')
+        partial = components.pop()
+        trie, path = self._trie, ''
+        for component in components:
+            trie = trie.children.get(component)
+            if trie is None:
+                return
+            path = f'{path}/{component}' if path else component
+
+        stack = [(child, f'{path}/{name}' if path else name)
+                 for name, child in reversed(trie.children.items()) if name.startswith(partial)]
+        while stack:
+            trie, path = stack.pop()
+            yield path
+            stack.extend((child, f'{path}/{name}') for name, child in reversed(trie.children.items()))
+
+    def glob(self, pattern):
+        # fnmatch per component, '**' matches zero or more directories.
+        # Literal components are a dict lookup, so only matching branches
+        # are entered. Returns sorted paths.
+        parts = pattern.strip('/').split('/')
+        # One compiled matcher per wildcard component, reused at every level
+        matchers = [re.compile(translate(part)).match if part != '**' and _has_magic(part) else None
+                    for part in parts]
+        matches = set()
+        seen = set()
+        stack = [(self._trie, '', 0)]
+        while stack:
+            trie, path, i = stack.pop()
+            if (id(trie), i) in seen:
+                continue
+            seen.add((id(trie), i))
+
+            if i == len(parts):
+                if path:
+                    matches.add(path)
+                continue
+            part = parts[i]
+            if part == '**':
+                stack.append((trie, path, i + 1))
+                if i + 1 == len(parts):
+                    stack.extend((child, f'{path}/{name}' if path else name, i)
+                                 for name, child in trie.children.items())
+                else:
+                    # Only directories can absorb another level
+                    stack.extend((child, f'{path}/{name}' if path else name, i)
+                                 for name, child in trie.children.items() if child.children)
+            elif matchers[i] is not None:
+                match = matchers[i]
+                prefix = f'{path}/' if path else ''
+                if i + 1 == len(parts):
+                    matches.update(prefix + name for name in trie.children if match(name))
+                else:
+                    stack.extend((child, prefix + name, i + 1)
+                                 for name, child in trie.children.items() if match(name))
+            else:
+                child = trie.children.get(part)
+                if child is not None:
+                    stack.append((child, f'{path}/{part}' if path else part, i + 1))
+        return sorted(matches)
@@ -0,0 +1,84 @@
+import random
+import time
+from fnmatch import fnmatchcase
+
+from file_system_composite_pattern import Directory, File
+
+
+# Compares PathIndex with what the composite offers without it: a recursive
+# search for one path, and a full walk filtered by fnmatch for a glob.
+
+EXTENSIONS = ('.mp4', '.mkv', '.srt', '.jpg', '.txt')
+
+
+def make_tree(directories = 20_000, files_per_directory = 25, fanout = 6, seed = 11):
+    rng = random.Random(seed)
+    root = Directory('media')
+    nodes = [root]
+    for i in range(1, directories):
+        directory = Directory(f'd{i}')
+        nodes[(i - 1) // fanout].add(directory)
+        nodes.append(directory)
+    for directory in nodes:
+        for j in range(files_per_directory):
+            directory.add(File(f'f{j}{rng.choice(EXTENSIONS)}', rng.randrange(1, 10_000)))
+    return root
+
+
+def search(directory, components):
+    # The only lookup the plain composite supports: scan children by name
+    if not components:
+        return directory
+    for child in directory.get_children():
+        if child.get_name() == components[0]:
+            return child if len(components) == 1 else search(child, components[1:])
+    return None
+
+
+def walk_glob(root, pattern):
+    return sorted(f'{root.get_name()}/{path}' for path, node in root.walk()
+                  if path and fnmatchcase(f'{root.get_name()}/{path}', pattern))
+
+
+def per_call(fn, args, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn(*args)
+    return (time.perf_counter() - start) / number
+
+
+if __name__ == '__main__':
+    root = make_tree()
+    start = time.perf_counter()
+    index = root.index()
+    print(f'indexed {len(index):,} paths in {time.perf_counter() - start:.2f}s')
+
+    paths = [path for path in index.iter_prefix('media/') if path.endswith('.mp4')]
+    target = max(paths, key = lambda path: path.count('/'))
+    components = target.split('/')[1:]
+    assert search(root, components) is index.resolve(target)
+    print(f'resolve {target}: search {per_call(search, (root, components), 200) * 1e6:,.1f}us, '
+          f'index {per_call(index.resolve, (target,), 100_000) * 1e6:.2f}us')
+
+    # A narrow glob: fixed directories, then a wildcard
+    parent = target.rsplit('/', 1)[0]
+    pattern = f'{parent}/*.mp4'
+    assert index.glob(pattern) == walk_glob(root, pattern)
+    print(f'glob {pattern}: full walk {per_call(walk_glob, (root, pattern), 3) * 1e3:,.1f}ms, '
+          f'index {per_call(index.glob, (pattern,), 1000) * 1e6:,.1f}us')
+
+    # fnmatch's '*' crosses '/', so compare '**/*.mp4' against a suffix check
+    start = time.perf_counter()
+    expected = sorted(f'media/{path}' for path, node in root.walk() if path.endswith('.mp4'))
+    walked = time.perf_counter() - start
+    start = time.perf_counter()
+    found = index.glob('**/*.mp4')
+    assert found == expected
+    print(f'glob **/*.mp4 ({len(found):,} matches): full walk {walked * 1e3:,.0f}ms, '
+          f'index {(time.perf_counter() - start) * 1e3:,.0f}ms')
+
+    # Additions after indexing are visible immediately
+    extra = Directory('new')
+    extra.add(File('trailer.mp4', 100))
+    search(root, components[:-1]).add(extra)
+    print(f'added after indexing: {index.glob(parent + "/new/*.mp4")}')
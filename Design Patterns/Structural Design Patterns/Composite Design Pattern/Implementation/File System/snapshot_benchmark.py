@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from path_index_benchmark import make_tree
+
+
+# Saves a ~1M-node tree and compares, each in a fresh interpreter, building
+# the tree from scratch with loading the snapshot and touching one path, or
+# loading it and walking all of it. Peak RSS is reported for each.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Peak RSS comes from VmHWM; ru_maxrss would include the parent's peak
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - start
+peak = next(line for line in open('/proc/self/status') if line.startswith('VmHWM')).split()[1]
+print(elapsed, int(peak) // 1024)
+'''
+
+SCENARIOS = {
+    'rebuild tree': 'from path_index_benchmark import make_tree\nroot = make_tree(40_000, 25)',
+    'load + one path': ('from file_system_composite_pattern import load_snapshot\n'
+                        'root = load_snapshot(sys.argv[1])\n'
+                        'node = root\n'
+                        'for name in sys.argv[2].split("/")[1:]:\n'
+                        '    node = next(c for c in node.get_children() if c.get_name() == name)'),
+    'load + walk all': ('from file_system_composite_pattern import load_snapshot\n'
+                        'root = load_snapshot(sys.argv[1])\n'
+                        'count = sum(1 for _ in root.walk())'),
+}
+
+
+def run(setup, *args):
+    output = subprocess.run([sys.executable, '-c', PROBE.format(setup = setup), *args], cwd = HERE,
+                            capture_output = True, text = True, check = True).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+if __name__ == '__main__':
+    root = make_tree(40_000, 25)
+    count = sum(1 for _ in root.walk())
+    deep = max((path for path, node in root.walk()), key = lambda path: path.count('/'))
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, 'tree.snapshot')
+        start = time.perf_counter()
+        root.save_snapshot(snapshot)
+        print(f'{count:,} nodes saved in {time.perf_counter() - start:.2f}s, '
+              f'{os.path.getsize(snapshot) / 2**20:.1f}MB ({os.path.getsize(snapshot) / count:.0f} bytes/node)')
+        del root
+
+        for name, setup in SCENARIOS.items():
+            elapsed, rss = run(setup, snapshot, f'media/{deep}')
+            print(f'{name:>16}: {elapsed * 1e3:8,.1f}ms, peak RSS {rss:,}MB')
@@ -0,0 +1,88 @@
+import random
+import time
+
+from composite_design_pattern_demo import BankManager, Cashier
+
+
+# Builds an org tree of ~500k employees and compares the cached subtree
+# aggregates with a recursive walk that recomputes them on every query.
+
+def build_org(size, fanout = 8, seed = 7):
+    rng = random.Random(seed)
+    root = BankManager(0, 'CEO', 5_000_000)
+    managers = [root]
+    next_id = 1
+    while next_id < size:
+        boss = managers[(next_id - 1) // fanout]
+        if next_id % 4:
+            emp = Cashier(next_id, f'cashier{next_id}', rng.randrange(200_000, 900_000))
+        else:
+            emp = BankManager(next_id, f'manager{next_id}', rng.randrange(900_000, 3_000_000))
+            managers.append(emp)
+        boss.add(emp)
+        next_id += 1
+    return root, managers
+
+
+def naive_aggregates(emp):
+    total, count, max_salary = emp.get_salary(), 1, emp.get_salary()
+    for child in emp.get_children():
+        child_total, child_count, child_max = naive_aggregates(child)
+        total += child_total
+        count += child_count
+        max_salary = max(max_salary, child_max)
+    return total, count, max_salary
+
+
+def per_call(fn, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def _reports_to(emp, manager):
+    while emp is not None:
+        if emp is manager:
+            return True
+        emp = emp.parent
+    return False
+
+
+def _depth(emp):
+    depth, stack = 0, [(emp, 1)]
+    while stack:
+        emp, level = stack.pop()
+        depth = max(depth, level)
+        stack.extend((child, level + 1) for child in emp.get_children())
+    return depth
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    root, managers = build_org(500_000)
+    print(f'built {root.get_headcount():,} employees in {time.perf_counter() - start:.2f}s')
+
+    assert naive_aggregates(root) == (root.get_total_salary(), root.get_headcount(), root.get_max_salary())
+
+    naive = per_call(lambda: naive_aggregates(root), 3)
+    cached = per_call(lambda: (root.get_total_salary(), root.get_headcount(), root.get_max_salary()), 100_000)
+    print(f'whole-org query: recursive {naive * 1e3:.1f}ms, cached {cached * 1e9:.0f}ns ({naive / cached:,.0f}x)')
+
+    # Move a random team to another manager: remove + add, each O(depth)
+    rng = random.Random(1)
+    moves = 20_000
+    elapsed = 0.0
+    for _ in range(moves):
+        team = rng.choice(managers[1:])
+        target = rng.choice(managers)
+        while target is team or _reports_to(target, team):
+            target = rng.choice(managers)
+        start = time.perf_counter()
+        team.parent.remove(team)
+        target.add(team)
+        elapsed += time.perf_counter() - start
+    print(f'move a team (remove + add): {elapsed / moves * 1e6:.1f}us, tree depth now {_depth(root)}')
+
+    assert naive_aggregates(root) == (root.get_total_salary(), root.get_headcount(), root.get_max_salary())
+    print('cached aggregates still match the recursive walk')
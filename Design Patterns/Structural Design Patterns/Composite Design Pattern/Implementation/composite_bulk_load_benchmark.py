@@ -0,0 +1,78 @@
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from composite_design_pattern_demo import BankManager, Cashier
+
+
+# Writes a parent-child CSV with a few million rows and compares
+# BankManager.from_csv (link everything, then one bottom-up aggregate pass)
+# with building the same tree through add(). Also walks a 100k-deep chain
+# with the iterative traversals, which would overflow a recursive walk.
+
+def write_org_csv(path, rows, fanout = 8, seed = 3):
+    rng = random.Random(seed)
+    with open(path, 'w', newline = '') as f:
+        writer = csv.writer(f)
+        writer.writerow(('id', 'parent_id', 'name', 'salary', 'role'))
+        writer.writerow((0, '', 'CEO', 5_000_000, 'manager'))
+        managers = [0]
+        for id in range(1, rows):
+            role = 'manager' if id % 4 == 0 else 'cashier'
+            writer.writerow((id, managers[(id - 1) // fanout], f'emp{id}', rng.randrange(200_000, 3_000_000), role))
+            if role == 'manager':
+                managers.append(id)
+
+
+def load_with_add(path):
+    nodes = {}
+    root = None
+    with open(path, newline = '') as f:
+        rows = csv.reader(f)
+        next(rows)
+        for id, parent_id, name, salary, role in rows:
+            id = int(id)  # same parsing as from_csv
+            node = nodes[id] = (BankManager if role == 'manager' else Cashier)(id, name, int(salary))
+            if parent_id:
+                nodes[int(parent_id)].add(node)
+            else:
+                root = node
+    return root
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in (1_000_000, 3_000_000):
+            path = os.path.join(directory, f'org{rows}.csv')
+            write_org_csv(path, rows)
+
+            root, bulk = timed(BankManager.from_csv, path)
+            headcount, total = root.get_headcount(), root.get_total_salary()
+            del root
+            line = f'{rows:>9,} rows: from_csv {bulk:.2f}s ({rows / bulk:,.0f} rows/s)'
+            if rows <= 1_000_000:
+                root, incremental = timed(load_with_add, path)
+                assert (root.get_headcount(), root.get_total_salary()) == (headcount, total)
+                del root
+                line += f', add() per row {incremental:.2f}s'
+            print(line)
+
+        # A 100k-deep reporting chain, loaded in linear time by from_csv
+        path = os.path.join(directory, 'chain.csv')
+        with open(path, 'w', newline = '') as f:
+            writer = csv.writer(f)
+            writer.writerow(('id', 'parent_id', 'name', 'salary', 'role'))
+            writer.writerows((id, id - 1 if id else '', f'm{id}', 1, 'manager') for id in range(100_000))
+        top = BankManager.from_csv(path)
+        print(f'recursion limit {sys.getrecursionlimit()}: depth-first walk visited '
+              f'{sum(1 for _ in top.iter_depth_first()):,} nodes, '
+              f'breadth-first {sum(1 for _ in top.iter_breadth_first()):,}')
@@ -1,7 +1,16 @@
+import csv
+import gc
+from collections import deque
+from itertools import islice
+
+from org_index import EulerTourIndex
+
 #Component Interface that acts as blueprint for parent and child
 class Employee:
+    __slots__ = ('parent',)  # parent is set by BankManager.add
+
     def get_id(self):
-        pass 
+        pass
 
     def get_name(self):
         pass
@@ -9,8 +18,18 @@ class Employee:
     def get_salary(self):
         pass
 
+    # Subtree aggregates, including the employee itself
+    def get_total_salary(self):
+        pass
+
+    def get_headcount(self):
+        pass
+
+    def get_max_salary(self):
+        pass
+
     def print(self):
-        pass 
+        pass
 
     def add(self, emp):
         pass
@@ -21,72 +40,278 @@ class Employee:
     def getChild(self, index):
         pass
 
+    def get_children(self):
+        pass
+
+    # Explicit-stack traversals, safe on hierarchies of any depth
+    def iter_depth_first(self):
+        stack = [self]
+        while stack:
+            emp = stack.pop()
+            yield emp
+            children = list(emp.get_children())
+            children.reverse()  # so children come out in insertion order
+            stack.extend(children)
+
+    def iter_breadth_first(self):
+        queue = deque([self])
+        while queue:
+            emp = queue.popleft()
+            yield emp
+            queue.extend(emp.get_children())
+
 # Parent Class
 class BankManager(Employee):
+    # Every manager caches the aggregates of its subtree. add/remove push the
+    # change up the parent chain, so queries are O(1) and updates O(depth).
+    # Children are keyed by employee id for O(1) lookup and removal.
+    # Reporting-line queries go through an EulerTourIndex over the subtree,
+    # built on first use and dropped whenever add/remove passes through.
+    __slots__ = ('__id', '__name', '__salary', '__emps', '__total_salary', '__headcount', '__max_salary',
+                 '__index')
+
     def __init__(self, id, name, salary):
-        self.__id = id 
+        self.parent = None
+        self.__id = id
         self.__name = name
         self.__salary = salary
-        self.__emps = []
-    
+        self.__emps = {}
+        self.__total_salary = salary
+        self.__headcount = 1
+        self.__max_salary = salary
+        self.__index = None
+
     def get_id(self):
         return self.__id
-    
+
     def get_name(self):
         return self.__name
-    
+
     def get_salary(self):
         return self.__salary
 
+    def get_total_salary(self):
+        return self.__total_salary
+
+    def get_headcount(self):
+        return self.__headcount
+
+    def get_max_salary(self):
+        return self.__max_salary
+
     def print(self):
-        for emp in self.__emps:
+        for emp in self.__emps.values():
             print(emp)
-    
+
     def add(self, emp):
-        self.__emps.append(emp)
-    
+        if emp.parent is not None:
+            raise ValueError(f'Employee {emp.get_id()} already reports to {emp.parent.get_id()}')
+        if emp.get_id() in self.__emps:
+            raise ValueError(f'Duplicate employee id {emp.get_id()}')
+        node = self
+        while node is not None:  # linking an ancestor would make a cycle
+            if node is emp:
+                raise ValueError(f'Employee {emp.get_id()} cannot report to {self.__id}, that would make a cycle')
+            node = node.parent
+        self.__emps[emp.get_id()] = emp
+        emp.parent = self
+
+        total, count, max_salary = emp.get_total_salary(), emp.get_headcount(), emp.get_max_salary()
+        node = self
+        while node is not None:
+            node.__index = None
+            node.__total_salary += total
+            node.__headcount += count
+            if max_salary > node.__max_salary:
+                node.__max_salary = max_salary
+            node = node.parent
+
     def remove(self, emp):
-        self.__emps.remove(emp)
-    
+        if self.__emps.get(emp.get_id()) is not emp:
+            raise ValueError(f'Employee {emp.get_id()} does not report to {self.__id}')
+        del self.__emps[emp.get_id()]
+        emp.parent = None
+
+        total, count, max_salary = emp.get_total_salary(), emp.get_headcount(), emp.get_max_salary()
+        node = self
+        while node is not None:
+            node.__index = None
+            node.__total_salary -= total
+            node.__headcount -= count
+            # A max can't be subtracted: recompute it from the children's
+            # cached maxes, but only while the removed subtree held the max
+            if max_salary is not None and max_salary >= node.__max_salary:
+                previous = node.__max_salary
+                node.__max_salary = max([node.__salary] + [e.get_max_salary() for e in node.__emps.values()])
+                if node.__max_salary == previous:
+                    max_salary = None  # unchanged here, so unchanged further up
+            else:
+                max_salary = None
+            node = node.parent
+
     def getChild(self, index):
-        return self.__emps[index]
+        # Positional access walks the insertion order (from the end for
+        # negative indexes); prefer get_child_by_id
+        if index < 0:
+            children, index = reversed(self.__emps.values()), -index - 1
+        else:
+            children = iter(self.__emps.values())
+        for emp in islice(children, index, None):
+            return emp
+        raise IndexError('child index out of range')
+
+    def get_child_by_id(self, id):
+        return self.__emps.get(id)
+
+    def get_children(self):
+        return iter(self.__emps.values())
+
+    def get_index(self):
+        if self.__index is None:
+            self.__index = EulerTourIndex(self)
+        return self.__index
+
+    def reports_to(self, emp, manager):
+        # Directly or through any chain of managers, within this tree
+        return emp is not manager and self.get_index().is_ancestor(manager, emp)
+
+    def lowest_common_manager(self, a, b):
+        # The deepest employee with both a and b in its subtree; that is a or
+        # b itself when one of them manages the other
+        return self.get_index().lowest_common_ancestor(a, b)
+
+    @classmethod
+    def from_csv(cls, path):
+        # Builds the whole tree from rows of id,parent_id,name,salary,role
+        # (role is 'manager' or 'cashier', the root has an empty parent_id).
+        # Children are linked directly and each node's aggregates are pushed
+        # into its parent once, bottom-up, so the load is O(rows) rather than
+        # O(rows * depth) through add().
+        nodes = {}
+        links = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()  # millions of new objects, none of them garbage yet
+        try:
+            with open(path, newline = '') as f:
+                rows = csv.reader(f)
+                next(rows)  # header
+                for id, parent_id, name, salary, role in rows:
+                    # Ids are ints everywhere else (get_child_by_id(2)), not CSV strings
+                    try:
+                        id = int(id)
+                        parent_id = int(parent_id) if parent_id else None
+                    except ValueError:
+                        raise ValueError(f'Non-integer employee id in row {id!r},{parent_id!r}') from None
+                    if id in nodes:
+                        raise ValueError(f'Duplicate employee id {id}')
+                    node = nodes[id] = (cls if role == 'manager' else Cashier)(id, name, int(salary))
+                    links.append((id, node, parent_id))
+
+            root = None
+            for id, node, parent_id in links:
+                if parent_id is None:
+                    if root is not None:
+                        raise ValueError(f'More than one root: {root.get_id()} and {id}')
+                    root = node
+                    continue
+                parent = nodes.get(parent_id)
+                if parent is None:
+                    raise ValueError(f'Employee {id} reports to unknown id {parent_id}')
+                if not isinstance(parent, BankManager):
+                    raise ValueError(f'Employee {id} reports to non-manager {parent_id}')
+                parent.__emps[id] = node
+                node.parent = parent
+            if root is None:
+                raise ValueError('No root row (empty parent_id) found')
+            del links
+
+            order = [root]  # breadth-first, grows while it is iterated
+            for node in order:
+                if isinstance(node, BankManager):
+                    order.extend(node.__emps.values())
+            if len(order) != len(nodes):
+                raise ValueError('Reporting cycle: some employees are not reachable from the root')
+
+            for node in reversed(order):  # children before their parents
+                parent = node.parent
+                if parent is not None:
+                    parent.__total_salary += node.get_total_salary()
+                    parent.__headcount += node.get_headcount()
+                    if node.get_max_salary() > parent.__max_salary:
+                        parent.__max_salary = node.get_max_salary()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return root
 
 
 # Child Class
 class Cashier(Employee):
+    __slots__ = ('__id', '__name', '__salary')
+
     def __init__(self, id, name, salary):
-        self.__id = id 
+        self.parent = None
+        self.__id = id
         self.__name = name
         self.__salary = salary
-    
+
     def get_id(self):
         return self.__id
 
     def get_name(self):
         return self.__name
-    
+
     def get_salary(self):
         return self.__salary
-    
+
+    def get_total_salary(self):
+        return self.__salary
+
+    def get_headcount(self):
+        return 1
+
+    def get_max_salary(self):
+        return self.__salary
+
     def add(self, emp):
         raise NotImplementedError('Operation not supported for child')
-    
+
     def remove(self, emp):
         raise NotImplementedError('Operation not supported for child')
-    
+
     def getChild(self, index):
         return None
-    
+
+    def get_children(self):
+        return iter(())
+
     def __str__(self) :
         return f'Cashier id = {self.__id}, name = {self.__name}, salary = {self.__salary}'
 
 
-emp1 = Cashier(1, 'Aravind reddy', 100000)
-emp2 = Cashier(2, 'Pandi Anil', 600000)
+# Client Code
+if __name__ == '__main__':
+    emp1 = Cashier(1, 'Aravind reddy', 100000)
+    emp2 = Cashier(2, 'Pandi Anil', 600000)
+
+    manager = BankManager(3, 'Anil', 1000000)
+
+    manager.add(emp1)
+    manager.add(emp2)
+
+    manager.print()
 
-manager = BankManager(3, 'Anil', 1000000)
+    branch = BankManager(4, 'Ravi', 1500000)
+    branch.add(manager)
+    sita = Cashier(5, 'Sita', 2000000)
+    branch.add(sita)
+    print(f'branch payroll = {branch.get_total_salary()}, headcount = {branch.get_headcount()}, '
+          f'max salary = {branch.get_max_salary()}')
 
-manager.add(emp1)
-manager.add(emp2)
+    print(f'Aravind reports to Ravi: {branch.reports_to(emp1, branch)}, '
+          f'to Sita: {branch.reports_to(emp1, sita)}')
+    print(f'lowest common manager of Aravind and Sita: {branch.lowest_common_manager(emp1, sita).get_name()}')
 
-manager.print()
\ No newline at end of file
+    branch.remove(manager)
+    print(f'after moving Anil\'s team out: payroll = {branch.get_total_salary()}, '
+          f'headcount = {branch.get_headcount()}, max salary = {branch.get_max_salary()}')
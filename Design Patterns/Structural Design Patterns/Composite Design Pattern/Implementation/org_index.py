@@ -0,0 +1,76 @@
+class EulerTourIndex:
+    # Snapshot index over a composite subtree. Nodes are numbered in
+    # depth-first (pre)order: a node's subtree is exactly the numbers
+    # entry[node] .. exit[node], so an ancestor test is two comparisons.
+    # Lowest common ancestors come from a sparse table of range minima over
+    # the depths in that order, O(n log n) to build and O(1) per query.
+
+    def __init__(self, root):
+        self.root = root
+        order = []
+        depth = []
+        entry = {}
+        stack = [(root, 0)]
+        while stack:
+            node, level = stack.pop()
+            entry[node] = len(order)
+            order.append(node)
+            depth.append(level)
+            children = list(node.get_children())
+            children.reverse()
+            stack.extend((child, level + 1) for child in children)
+
+        size = [1] * len(order)
+        for position in range(len(order) - 1, 0, -1):
+            parent = order[position].parent
+            size[entry[parent]] += size[position]
+
+        self._order = order
+        self._entry = entry
+        self._exit = [position + count - 1 for position, count in enumerate(size)]
+
+        # Level k holds, for every start i, min over depth[i : i + 2**k]
+        # encoded as depth * n + position, so one comparison orders by depth.
+        # Every level shares the int objects of level 0, so a level costs one
+        # pointer per entry.
+        n = len(order)
+        table = [[d * n + position for position, d in enumerate(depth)]]
+        width = 1
+        while width * 2 <= n:
+            previous = table[-1]
+            table.append([x if x < y else y for x, y in zip(previous, previous[width:])])
+            width *= 2
+        self._table = table
+        self._n = n
+
+    def __len__(self):
+        return self._n
+
+    def __contains__(self, emp):
+        return emp in self._entry
+
+    def _position(self, emp):
+        position = self._entry.get(emp)
+        if position is None:
+            raise ValueError(f'Employee {emp.get_id()} is not in the tree under {self.root.get_id()}')
+        return position
+
+    def is_ancestor(self, ancestor, emp):
+        # True if emp is in ancestor's subtree (an employee counts as its own ancestor)
+        a, e = self._position(ancestor), self._position(emp)
+        return a <= e <= self._exit[a]
+
+    def lowest_common_ancestor(self, a, b):
+        left, right = self._position(a), self._position(b)
+        if left > right:
+            left, right = right, left
+        if right <= self._exit[left]:
+            return self._order[left]  # a contains b, or the other way round
+        # The shallowest node strictly after `left` and up to `right` is a
+        # child of the common ancestor
+        left += 1
+        level = (right - left + 1).bit_length() - 1
+        row = self._table[level]
+        x, y = row[left], row[right - (1 << level) + 1]
+        shallowest = (x if x < y else y) % self._n
+        return self._order[shallowest].parent
@@ -0,0 +1,95 @@
+import csv
+import os
+import random
+import tempfile
+import time
+
+from composite_aggregate_benchmark import build_org
+from composite_design_pattern_demo import BankManager
+
+
+# Compares the Euler-tour index with answering the same questions without
+# one: walking up parent pointers for "does X report to Y", and collecting
+# both reporting chains for the lowest common manager. Runs on a bushy org
+# and on a deep one, where the walks get long.
+
+def walk_reports_to(emp, manager):
+    emp = emp.parent
+    while emp is not None:
+        if emp is manager:
+            return True
+        emp = emp.parent
+    return False
+
+
+def walk_common_manager(a, b):
+    chain = set()
+    while a is not None:
+        chain.add(a)
+        a = a.parent
+    while b not in chain:
+        b = b.parent
+    return b
+
+
+def deep_org(directory, levels, cashiers_per_manager = 4):
+    # A chain of managers, each with a few cashiers, loaded through from_csv
+    path = os.path.join(directory, 'deep.csv')
+    with open(path, 'w', newline = '') as f:
+        writer = csv.writer(f)
+        writer.writerow(('id', 'parent_id', 'name', 'salary', 'role'))
+        stride = cashiers_per_manager + 1  # each manager's id is followed by its cashiers' ids
+        for level in range(levels):
+            manager_id = level * stride
+            writer.writerow((manager_id, manager_id - stride if level else '', f'manager{level}', 1_000_000, 'manager'))
+            for i in range(1, stride):
+                writer.writerow((manager_id + i, manager_id, f'cashier{level}.{i}', 300_000, 'cashier'))
+    return BankManager.from_csv(path)
+
+
+def per_query(fn, pairs):
+    start = time.perf_counter()
+    for a, b in pairs:
+        fn(a, b)
+    return (time.perf_counter() - start) / len(pairs)
+
+
+def compare(name, root, rng, queries = 5_000):
+    employees = list(root.iter_depth_first())
+    managers = [e for e in employees if isinstance(e, BankManager)]
+
+    start = time.perf_counter()
+    index = root.get_index()
+    print(f'{name}: index over {len(index):,} employees built in {time.perf_counter() - start:.2f}s')
+
+    pairs = [(rng.choice(employees), rng.choice(managers)) for _ in range(queries)]
+    for emp, manager in pairs[:500]:
+        assert root.reports_to(emp, manager) == walk_reports_to(emp, manager)
+    walked = per_query(walk_reports_to, pairs)
+    indexed = per_query(root.reports_to, pairs)
+    print(f'  reports_to: parent walk {walked * 1e6:,.2f}us, index {indexed * 1e6:.2f}us')
+
+    pairs = [(rng.choice(employees), rng.choice(employees)) for _ in range(queries)]
+    for a, b in pairs[:500]:
+        assert root.lowest_common_manager(a, b) is walk_common_manager(a, b)
+    walked = per_query(walk_common_manager, pairs)
+    indexed = per_query(root.lowest_common_manager, pairs)
+    print(f'  lowest_common_manager: chain walk {walked * 1e6:,.2f}us, index {indexed * 1e6:.2f}us')
+
+    # A structural change drops the index; the next query rebuilds it
+    team = rng.choice(managers[1:])
+    team.parent.remove(team)
+    root.add(team)
+    start = time.perf_counter()
+    assert root.reports_to(team, root)
+    print(f'  rebuilt lazily after a move in {time.perf_counter() - start:.2f}s')
+
+
+if __name__ == '__main__':
+    rng = random.Random(5)
+    root, _ = build_org(500_000)
+    compare('bushy org', root, rng)
+    del root
+
+    with tempfile.TemporaryDirectory() as directory:
+        compare('deep org', deep_org(directory, 20_000), rng)